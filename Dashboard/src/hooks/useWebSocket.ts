@@ -59,7 +59,17 @@ export const useWebSocket = ({
           }
 
           if (onMessage) {
-            onMessage(message);
+            if (message.type === 'task_changed_batch') {
+              // The monitor sends all rows changed in one poll as a single frame;
+              // listeners still receive one task_changed message per task
+              message.data.forEach((task: any) => onMessage({
+                type: 'task_changed',
+                data: task,
+                timestamp: message.timestamp
+              }));
+            } else {
+              onMessage(message);
+            }
           }
         } catch (error) {
           console.error('Error parsing WebSocket message:', error);
@@ -3,34 +3,45 @@ DevMind Unified MCP Server - Complete Integration
 Combines all tools from Jira, Oracle Knowledge Base, and SVN servers into one comprehensive MCP server.
 
 Tools included:
-1. Jira API Tools (13 tools) - Complete Jira integration + Knowledge Base search + KB management
+1. Jira API Tools (18 tools) - Complete Jira integration + Knowledge Base search + KB management
 2. Oracle Standards Tools (2 tools) - Oracle development guidelines  
-3. SVN Tools (4 tools) - Source control operations
-4. SVN Path Tools (2 tools) - SVN path mapping and discovery
+3. SVN Tools (5 tools) - Source control operations
+4. SVN Path Tools (3 tools) - SVN path mapping and discovery
 
-Total: 21 integrated tools for complete development workflow
+Total: 28 integrated tools for complete development workflow
 """
 
 import asyncio
+import concurrent.futures
 import configparser
+import functools
+import hashlib
+import heapq
 import io
 import json
 import logging
 import os
+import re
+import shutil
 import sqlite3
 import subprocess
 import sys
-import tempfile
+import threading
+import time
 import traceback
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
 import urllib3
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 from requests.auth import HTTPBasicAuth
 
+from db import get_conn, get_lock
+
 # Optional imports for document processing
 try:
     from docx import Document
@@ -38,6 +49,20 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+# tomllib ships with Python 3.11+; older interpreters keep using the INI file
+try:
+    import tomllib
+    TOML_AVAILABLE = True
+except ImportError:
+    TOML_AVAILABLE = False
+
+# Optional faster JSON serialization for tool responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Set UTF-8 encoding for stdout and stderr
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8')
@@ -61,13 +86,115 @@ mcp = FastMCP("DevMind_Unified")
 # Constants
 DEFAULT_ISSUE_SUMMARY_SEPARATOR = "=" * 70
 DEFAULT_DESCRIPTION_SEPARATOR = "-" * 60
+DEFAULT_SECTION_SEPARATOR = "=" * 80
+DEFAULT_SECTION_DIVIDER = "-" * 80
 DEFAULT_SVN_TIMEOUT = 30
+JIRA_CACHE_TTL = 60  # seconds user info and transitions are reused
+JIRA_KB_CACHE_TTL = 60  # seconds a similarity search is reused (Load_knowledge.py rewrites jira_kb externally)
+JIRA_KB_CACHE_SIZE = 256  # distinct similarity searches kept in memory
 DEFAULT_BASE_URL = "https://svn.bansel.it/h2o"
 DB_DIR = r"\\nas3be\ITCrediti\DevMind"
 ORACLE_STANDARDS_DB = os.path.join(DB_DIR, "oracle_standards.db")
 JIRA_DASHBOARD_DB = os.path.join(DB_DIR, "mcp_dashboard.db")
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as indented JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass  # e.g. non-string dict keys; the stdlib encoder handles those
+    return json.dumps(obj, indent=2)
+
+
+# One-time lookup indexes for the dashboard database, applied on first connect;
+# (table, DDL) pairs, so an index is only created when its table exists
+DASHBOARD_SCHEMA_MIGRATION = (
+    ("svn_path", "CREATE INDEX IF NOT EXISTS idx_svn_path_component_key ON svn_path(component_name, key);"),
+    ("jira_prompts", "CREATE INDEX IF NOT EXISTS idx_jira_prompts_jira_number ON jira_prompts(jira_number, p_id);"),
+    ("jira_tmp_prompts", "CREATE INDEX IF NOT EXISTS idx_jira_tmp_prompts_jira_no ON jira_tmp_prompts(jira_no);"),
+)
+_schema_initialized: Dict[str, bool] = {}
+_schema_lock = threading.Lock()
+
+
+def _ensure_schema(connection: sqlite3.Connection, db_path: str) -> None:
+    """Run DASHBOARD_SCHEMA_MIGRATION once per process for the given database, until it succeeds"""
+    if _schema_initialized.get(db_path):
+        return
+    with _schema_lock:
+        if _schema_initialized.get(db_path):
+            return
+        try:
+            tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            missing = [table for table, _ in DASHBOARD_SCHEMA_MIGRATION if table not in tables]
+            if missing:
+                logger.info(f"No index created for missing tables in {db_path}: {', '.join(missing)}")
+            connection.executescript("\n".join(
+                ["BEGIN IMMEDIATE;"]
+                + [ddl for table, ddl in DASHBOARD_SCHEMA_MIGRATION if table in tables]
+                + ["COMMIT;"]
+            ))
+        except sqlite3.Error as e:
+            if connection.in_transaction:
+                connection.rollback()
+            # Not marked as done, so the next connect retries (e.g. the share was busy)
+            logger.warning(f"Schema migration skipped for {db_path}: {e}")
+            return
+        _schema_initialized[db_path] = True
+
+
+class SQLiteSessionMixin:
+    """Shared connect/commit/rollback/disconnect handling for the SQLite managers
+    
+    Every manager works on the process-wide connection for its db_path (see
+    db.py), held exclusively for the length of a session. Subclasses set
+    db_path, a CONNECT_ERROR message and, for databases other than the
+    dashboard, APPLY_DASHBOARD_SCHEMA = False and USE_WAL = False.
+    """
+    
+    CONNECT_ERROR = "Could not connect to database"
+    APPLY_DASHBOARD_SCHEMA = True
+    USE_WAL = True
+    
+    def _connect(self) -> bool:
+        try:
+            if not os.path.exists(self.db_path):
+                logger.error(f"Database file not found: {self.db_path}")
+                return False
+            lock = get_lock(self.db_path)
+            lock.acquire()
+            self.connection = get_conn(self.db_path, wal=self.USE_WAL)
+            if self.APPLY_DASHBOARD_SCHEMA:
+                _ensure_schema(self.connection, self.db_path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to database {self.db_path}: {str(e)}")
+            self._disconnect()
+            return False
+    
+    def _disconnect(self):
+        # The shared connection stays open; just hand it back to other threads
+        if self.connection:
+            self.connection = None
+            get_lock(self.db_path).release()
+    
+    @contextmanager
+    def _session(self):
+        """Yield a cursor; commit on success, roll back on error, always disconnect"""
+        if not self._connect():
+            raise ConnectionError(self.CONNECT_ERROR)
+        try:
+            yield self.connection.cursor()
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        finally:
+            self._disconnect()
+
+
 # ============================================================
 # CREDENTIALS MANAGER
 # ============================================================
@@ -78,13 +205,35 @@ class CredentialsManager:
         self.credentials_file = self._resolve_credentials_path(credentials_file)
         self.config = configparser.ConfigParser()
         
-        if self.credentials_file and os.path.exists(self.credentials_file):
+        # Prefer credentials.toml ([jira] and [svn] tables, as in the INI)
+        toml_file = self._resolve_credentials_path(os.path.splitext(credentials_file)[0] + '.toml')
+        if TOML_AVAILABLE and toml_file and toml_file.endswith('.toml') and self._load_toml(toml_file):
+            self.credentials_file = toml_file
+        elif self.credentials_file and os.path.exists(self.credentials_file):
             try:
                 self.config.read(self.credentials_file, encoding='utf-8')
                 logger.info(f"✅ Loaded credentials from: {self.credentials_file}")
             except Exception as e:
                 logger.error(f"❌ Error reading credentials file: {e}")
     
+    def _load_toml(self, toml_file: str) -> bool:
+        """Load a TOML credentials file into self.config; False if it is unusable"""
+        try:
+            with open(toml_file, 'rb') as f:
+                data = tomllib.load(f)
+            verify_ssl = data.get('jira', {}).get('verify_ssl', False)
+            if not isinstance(verify_ssl, bool):
+                raise ValueError(f"[jira] verify_ssl must be true or false, got {verify_ssl!r}")
+            self.config.read_dict({
+                section: {key: str(value) for key, value in values.items()}
+                for section, values in data.items() if isinstance(values, dict)
+            })
+            logger.info(f"✅ Loaded credentials from: {toml_file}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Error reading credentials file {toml_file}: {e}")
+            return False
+    
     def _resolve_credentials_path(self, filename: str) -> Optional[str]:
         """Resolve credentials file path"""
         # Priority 1: Environment variable
@@ -175,12 +324,32 @@ class JiraAPI:
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        # key -> (monotonic timestamp, value); only successful responses are stored
+        self._cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+    
+    def _cached(self, key: Tuple[str, ...], fetch: Callable[[], Any]) -> Any:
+        """Return a value younger than JIRA_CACHE_TTL for key, calling fetch on a miss"""
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < JIRA_CACHE_TTL:
+            return cached[1]
+        value = fetch()
+        if value is not None:
+            self._cache[key] = (time.monotonic(), value)
+        return value
+    
+    def clear_cache(self, issue_key: Optional[str] = None):
+        """Forget cached responses, or only the transitions of one issue"""
+        if issue_key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(('transitions', issue_key), None)
     
-    def get_issue(self, issue_key: str) -> Optional[Dict]:
-        """Get Jira issue details"""
+    def get_issue(self, issue_key: str, fields: Optional[str] = None) -> Optional[Dict]:
+        """Get Jira issue details, optionally restricted to a comma-separated list of fields"""
         try:
             url = f"{self.api_base}/issue/{issue_key}"
-            response = self.session.get(url)
+            params = {'fields': fields} if fields else None
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -188,17 +357,14 @@ class JiraAPI:
             return None
     
     def test_connection(self) -> bool:
-        """Test Jira connection"""
-        try:
-            url = f"{self.api_base}/myself"
-            response = self.session.get(url)
-            response.raise_for_status()
-            return True
-        except:
-            return False
+        """Test Jira connection (shares the cached /myself response with get_user_info)"""
+        return self.get_user_info() is not None
     
     def get_user_info(self) -> Optional[Dict]:
         """Get current user info"""
+        return self._cached(('myself',), self._fetch_user_info)
+    
+    def _fetch_user_info(self) -> Optional[Dict]:
         try:
             url = f"{self.api_base}/myself"
             response = self.session.get(url)
@@ -209,6 +375,9 @@ class JiraAPI:
     
     def get_transitions(self, issue_key: str) -> Optional[list]:
         """Get available transitions"""
+        return self._cached(('transitions', issue_key), lambda: self._fetch_transitions(issue_key))
+    
+    def _fetch_transitions(self, issue_key: str) -> Optional[list]:
         try:
             url = f"{self.api_base}/issue/{issue_key}/transitions"
             response = self.session.get(url)
@@ -217,6 +386,19 @@ class JiraAPI:
         except:
             return None
     
+    def get_transitions_with_status(self, issue_key: str) -> Tuple[Optional[list], str]:
+        """Get available transitions and the current status name in a single request"""
+        try:
+            url = f"{self.api_base}/issue/{issue_key}"
+            response = self.session.get(url, params={'fields': 'status', 'expand': 'transitions'})
+            response.raise_for_status()
+            issue_data = response.json()
+        except:
+            return None, 'Unknown'
+        transitions = issue_data.get('transitions', [])
+        self._cache[('transitions', issue_key)] = (time.monotonic(), transitions)
+        return transitions, issue_data.get('fields', {}).get('status', {}).get('name', 'Unknown')
+    
     def transition_issue(self, issue_key: str, transition_id: str, comment: Optional[str] = None) -> bool:
         """Execute transition"""
         try:
@@ -226,13 +408,22 @@ class JiraAPI:
                 payload["update"] = {"comment": [{"add": {"body": comment}}]}
             response = self.session.post(url, data=json.dumps(payload))
             response.raise_for_status()
+            # The issue is in a new status now, so its transitions have changed
+            self.clear_cache(issue_key)
             return True
         except:
             return False
     
-    def find_transition_by_name(self, issue_key: str, status_name: str) -> Tuple[Optional[str], Optional[str]]:
-        """Find transition by status name"""
-        transitions = self.get_transitions(issue_key)
+    def find_transition_by_name(self, issue_key: str, status_name: str,
+                                transitions: Optional[list] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Find transition by status name
+        
+        Pass transitions fetched together with the current status (see
+        get_transitions_with_status) when the id is about to be POSTed; the
+        cached list may predate a status change made in the Jira UI.
+        """
+        if transitions is None:
+            transitions = self.get_transitions(issue_key)
         if not transitions:
             return None, None
         
@@ -248,15 +439,20 @@ class JiraAPI:
         
         return None, None
     
-    def search_issues(self, jql_query: str, max_results: int = 50, start_at: int = 0) -> Optional[Dict]:
-        """Search issues with JQL"""
+    def search_issues(self, jql_query: str, max_results: int = 50, start_at: int = 0,
+                      fields: str = 'key,summary,status,assignee,priority,issuetype,created,updated') -> Optional[Dict]:
+        """Search issues with JQL
+        
+        Pass fields='*none' when only the total is needed; Jira then skips
+        serializing issue fields altogether.
+        """
         try:
             url = f"{self.api_base}/search"
             params = {
                 'jql': jql_query,
                 'maxResults': min(max_results, 100),
                 'startAt': start_at,
-                'fields': 'key,summary,status,assignee,priority,issuetype,created,updated'
+                'fields': fields
             }
             response = self.session.get(url, params=params)
             response.raise_for_status()
@@ -358,7 +554,7 @@ class JiraAPI:
                 
                 if content:
                     doc = Document(io.BytesIO(content))
-                    full_text = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
+                    full_text = [text for text in (p.text.strip() for p in doc.paragraphs) if text]
                     document_text = "\n".join(full_text)
                     
                     preview_length = min(2000, len(document_text))
@@ -375,41 +571,36 @@ class JiraAPI:
 # ============================================================
 # ORACLE STANDARDS KNOWLEDGE BASE
 # ============================================================
-class OracleStandardsKB:
+class OracleStandardsKB(SQLiteSessionMixin):
     """Oracle Standards Knowledge Base"""
     
+    CONNECT_ERROR = "Could not connect to Oracle Standards database"
+    APPLY_DASHBOARD_SCHEMA = False
+    USE_WAL = False  # Reference data shared read-only over the NAS; keep its rollback journal
+    
     def __init__(self, db_path: str = ORACLE_STANDARDS_DB):
         self.db_path = db_path
         self.connection = None
     
-    def _connect(self) -> bool:
+    @staticmethod
+    def _decode_parameters(parameters: Optional[str]) -> Union[Dict[str, str], str, None]:
+        """Parameters are stored as a JSON object; older databases hold free text"""
         try:
-            if not os.path.exists(self.db_path):
-                return False
-            self.connection = sqlite3.connect(self.db_path)
-            return True
-        except:
-            return False
-    
-    def _disconnect(self):
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+            return json.loads(parameters)
+        except (TypeError, ValueError):
+            return parameters
     
     def analyze_standards(self, requirement: str = None) -> Dict[str, Any]:
         """Analyze Oracle standards"""
-        if not self._connect():
-            return {"error": "Could not connect to Oracle Standards database"}
-        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT procedure_name, description, parameters, usage_example 
-                FROM oracle_standards 
-                ORDER BY procedure_name
-            """)
-            standards = cursor.fetchall()
-            
+            with self._session() as cursor:
+                cursor.execute("""
+                    SELECT procedure_name, description, parameters, usage_example
+                    FROM oracle_standards
+                    ORDER BY procedure_name
+                """)
+                standards = cursor.fetchall()
+
             result = {
                 "title": "Oracle Development Standards Analysis",
                 "svn_structure": {
@@ -432,7 +623,7 @@ class OracleStandardsKB:
                 "standard_procedures": {
                     "count": len(standards),
                     "procedures": [
-                        {"name": std[0], "description": std[1], "parameters": std[2], "usage_example": std[3]}
+                        {"name": std[0], "description": std[1], "parameters": self._decode_parameters(std[2]), "usage_example": std[3]}
                         for std in standards
                     ]
                 },
@@ -444,123 +635,153 @@ class OracleStandardsKB:
             }
             
             return result
+        except ConnectionError as e:
+            return {"error": str(e)}
         except Exception as e:
             return {"error": f"Error analyzing standards: {str(e)}"}
-        finally:
-            self._disconnect()
 
 
 # ============================================================
 # JIRA DASHBOARD MANAGER
 # ============================================================
-class JiraDashboardManager:
+class JiraDashboardManager(SQLiteSessionMixin):
     """Jira Dashboard Manager"""
     
     def __init__(self, db_path: str = JIRA_DASHBOARD_DB):
         self.db_path = db_path
         self.connection = None
     
-    def _connect(self) -> bool:
-        try:
-            if not os.path.exists(self.db_path):
-                return False
-            self.connection = sqlite3.connect(self.db_path)
-            return True
-        except:
-            return False
-    
-    def _disconnect(self):
-        if self.connection:
-            self.connection.close()
-            self.connection = None
-    
     def add_or_update_jira(self, jira_number: str, **kwargs) -> Dict[str, Any]:
         """Add or update Jira issue"""
-        if not self._connect():
-            return {"error": "Could not connect to database"}
-        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT id FROM jira_dashboard WHERE jira_number = ?", (jira_number,))
-            exists = cursor.fetchone()
-            
-            current_time = datetime.now().isoformat()
-            
-            if exists:
-                # Update logic
-                update_fields = []
-                update_values = []
-                for key, value in kwargs.items():
-                    if value is not None:
-                        update_fields.append(f"{key} = ?")
-                        update_values.append(value)
+            with self._session() as cursor:
+                cursor.execute("SELECT id FROM jira_dashboard WHERE jira_number = ?", (jira_number,))
+                exists = cursor.fetchone()
                 
-                if update_fields:
-                    update_fields.append("last_updated = ?")
-                    update_values.append(current_time)
-                    update_values.append(jira_number)
-                    sql = f"UPDATE jira_dashboard SET {', '.join(update_fields)} WHERE jira_number = ?"
-                    cursor.execute(sql, update_values)
-                    self.connection.commit()
+                # Full microsecond precision: the monitor tells updates apart by last_updated
+                current_time = datetime.now().isoformat()
+                current_date = current_time[:10]  # YYYY-MM-DD prefix of the ISO timestamp
                 
-                return {"status": "updated", "jira_number": jira_number}
-            else:
-                # Insert logic
-                cursor.execute("""
-                    INSERT INTO jira_dashboard 
-                    (jira_number, jira_heading, assignee, created, priority, type, 
-                     requirement_clarity, automation, comment, decision, status, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    jira_number,
-                    kwargs.get('jira_heading'),
-                    kwargs.get('assignee'),
-                    datetime.now().strftime("%Y-%m-%d"),
-                    kwargs.get('priority', 'Medium'),
-                    kwargs.get('issue_type', 'Story'),
-                    kwargs.get('requirement_clarity', 'Clear'),
-                    kwargs.get('automation', 'No'),
-                    kwargs.get('comment'),
-                    kwargs.get('decision', 'PENDING'),
-                    kwargs.get('status'),
-                    current_time
-                ))
-                self.connection.commit()
-                return {"status": "created", "jira_number": jira_number}
+                if exists:
+                    # Update logic
+                    update_fields = []
+                    update_values = []
+                    for key, value in kwargs.items():
+                        if value is not None:
+                            update_fields.append(f"{key} = ?")
+                            update_values.append(value)
+                    
+                    if update_fields:
+                        update_fields.append("last_updated = ?")
+                        update_values.append(current_time)
+                        update_values.append(jira_number)
+                        sql = f"UPDATE jira_dashboard SET {', '.join(update_fields)} WHERE jira_number = ?"
+                        cursor.execute(sql, update_values)
+                    
+                    return {"status": "updated", "jira_number": jira_number}
+                else:
+                    # Insert logic
+                    cursor.execute("""
+                        INSERT INTO jira_dashboard 
+                        (jira_number, jira_heading, assignee, created, priority, type, 
+                         requirement_clarity, automation, comment, decision, status, last_updated)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        jira_number,
+                        kwargs.get('jira_heading'),
+                        kwargs.get('assignee'),
+                        current_date,
+                        kwargs.get('priority', 'Medium'),
+                        kwargs.get('issue_type', 'Story'),
+                        kwargs.get('requirement_clarity', 'Clear'),
+                        kwargs.get('automation', 'No'),
+                        kwargs.get('comment'),
+                        kwargs.get('decision', 'PENDING'),
+                        kwargs.get('status'),
+                        current_time
+                    ))
+                    return {"status": "created", "jira_number": jira_number}
         except Exception as e:
             return {"error": str(e)}
-        finally:
-            self._disconnect()
 
 
 # ============================================================
 # SVN PATH MANAGER
 # ============================================================
-class SVNPathManager:
+@functools.lru_cache(maxsize=1)
+def _svn_base_url() -> str:
+    """SVN base URL from credentials, read once per process"""
+    return credentials.get_svn_base_url()
+
+
+# svn_path is read in one scan; fixed SQL text so the statement cache reuses the prepared statement
+SVN_PATH_ALL_MAPPINGS_SQL = "SELECT component_name, key, value FROM svn_path ORDER BY component_name, key"
+
+
+class SVNPathManager(SQLiteSessionMixin):
     """SVN Path Manager - Maps requirement types to SVN paths"""
     
+    CONNECT_ERROR = "Could not connect to SVN Path database"
+    
     def __init__(self, db_path: str = JIRA_DASHBOARD_DB):
         self.db_path = db_path
         self.connection = None
+        # svn_path is static configuration: the whole table is loaded into dicts once
+        # (see reload) and lookups never touch SQLite afterwards
+        self._paths: Optional[Dict[Tuple[str, str], str]] = None
+        self._types: Dict[str, Tuple[str, ...]] = {}
+        self._rows_by_component: Dict[str, Tuple[Tuple[str, str, str], ...]] = {}
+        self._all_rows: Tuple[Tuple[str, str, str], ...] = ()
     
-    def _connect(self) -> bool:
-        try:
-            if not os.path.exists(self.db_path):
-                logger.error(f"Database file not found: {self.db_path}")
-                return False
-            self.connection = sqlite3.connect(self.db_path, timeout=30.0)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to database: {str(e)}")
-            return False
-    
-    def _disconnect(self):
-        if self.connection:
-            try:
-                self.connection.close()
-            except:
-                pass
-            self.connection = None
+    def reload(self) -> int:
+        """Rebuild the in-memory mapping tables from one scan of svn_path
+        
+        Returns:
+            Number of mappings loaded. Raises ConnectionError if the database
+            cannot be opened, leaving the previous tables in place.
+        """
+        with self._session() as cursor:
+            cursor.execute(SVN_PATH_ALL_MAPPINGS_SQL)
+            rows = tuple(tuple(row) for row in cursor.fetchall())
+        
+        paths: Dict[Tuple[str, str], str] = {}
+        by_component: Dict[str, List[Tuple[str, str, str]]] = {}
+        for row in rows:
+            component, key, value = row
+            paths[(component, key)] = value
+            by_component.setdefault(component, []).append(row)
+        
+        self._all_rows = rows
+        self._rows_by_component = {c: tuple(r) for c, r in by_component.items()}
+        self._types = {c: tuple(row[1] for row in r) for c, r in by_component.items()}
+        self._paths = paths
+        _svn_base_url.cache_clear()
+        return len(rows)
+    
+    def _ensure_loaded(self):
+        if self._paths is None:
+            self.reload()
+    
+    def _lookup_svn_path(self, component_name: str,
+                         requirement_type: str) -> Tuple[Optional[Tuple[str, str, str]], Tuple[str, ...]]:
+        """Look up one mapping
+        
+        Returns:
+            (row, ()) on an exact match, or (None, available_types) when the
+            requirement type is unknown.
+        """
+        self._ensure_loaded()
+        value = self._paths.get((component_name, requirement_type))
+        if value is not None:
+            return (component_name, requirement_type, value), ()
+        return None, self._types.get(component_name, ())
+    
+    def _lookup_mappings(self, component_name: Optional[str]) -> Tuple[Tuple[str, str, str], ...]:
+        """(component_name, key, value) rows, optionally for one component"""
+        self._ensure_loaded()
+        if component_name:
+            return self._rows_by_component.get(component_name, ())
+        return self._all_rows
     
     def get_svn_path(self, component_name: str, requirement_type: str) -> Dict[str, Any]:
         """Get SVN path for a specific component and requirement type
@@ -572,68 +793,48 @@ class SVNPathManager:
         Returns:
             Dictionary with SVN path information or error message
         """
-        if not self._connect():
-            return {"error": "Could not connect to SVN Path database"}
-        
         try:
-            cursor = self.connection.cursor()
-            
-            # Query for exact match
-            query = """
-            SELECT id, component_name, key, value 
-            FROM svn_path
-            WHERE component_name = ? AND key = ?
-            """
-            cursor.execute(query, (component_name, requirement_type))
-            result = cursor.fetchone()
-            
-            if result:
-                # Check if value contains multiple paths (like package_creation)
-                svn_path_value = result[3]
-                
-                # Handle package_creation case which has spec and body paths
-                if '\n' in svn_path_value:
-                    paths = [p.strip() for p in svn_path_value.split('\n') if p.strip()]
-                    return {
-                        "component_name": result[1],
-                        "requirement_type": result[2],
-                        "svn_paths": paths,
-                        "is_multi_path": True,
-                        "full_paths": [f"{credentials.get_svn_base_url()}/{p}" for p in paths]
-                    }
-                else:
-                    # Single path
-                    return {
-                        "component_name": result[1],
-                        "requirement_type": result[2],
-                        "svn_path": svn_path_value,
-                        "is_multi_path": False,
-                        "full_path": f"{credentials.get_svn_base_url()}/{svn_path_value}"
-                    }
-            else:
-                # If exact match not found, try to find available types for this component
-                cursor.execute("""
-                    SELECT key FROM svn_path 
-                    WHERE component_name = ?
-                """, (component_name,))
-                available_types = [row[0] for row in cursor.fetchall()]
-                
-                if available_types:
-                    return {
-                        "error": f"No SVN path found for component '{component_name}' and requirement type '{requirement_type}'",
-                        "available_types": available_types,
-                        "suggestion": f"Please use one of these requirement types: {', '.join(available_types)}"
-                    }
-                else:
-                    return {
-                        "error": f"Component '{component_name}' not found in SVN path database",
-                        "suggestion": "Please check the component name or add it to the svn_path table"
-                    }
+            row, available_types = self._lookup_svn_path(component_name, requirement_type)
+        except ConnectionError as e:
+            return {"error": str(e)}
         except Exception as e:
             logger.error(f"Error in get_svn_path: {str(e)}")
             return {"error": f"Database error: {str(e)}"}
-        finally:
-            self._disconnect()
+        
+        if row:
+            found_component, found_type, svn_path_value = row
+            base_url = _svn_base_url()
+            
+            # Handle package_creation case which has spec and body paths
+            if '\n' in svn_path_value:
+                paths = [p for p in map(str.strip, svn_path_value.splitlines()) if p]
+                return {
+                    "component_name": found_component,
+                    "requirement_type": found_type,
+                    "svn_paths": paths,
+                    "is_multi_path": True,
+                    "full_paths": [f"{base_url}/{p}" for p in paths]
+                }
+            else:
+                # Single path
+                return {
+                    "component_name": found_component,
+                    "requirement_type": found_type,
+                    "svn_path": svn_path_value,
+                    "is_multi_path": False,
+                    "full_path": f"{base_url}/{svn_path_value}"
+                }
+        elif available_types:
+            return {
+                "error": f"No SVN path found for component '{component_name}' and requirement type '{requirement_type}'",
+                "available_types": list(available_types),
+                "suggestion": f"Please use one of these requirement types: {', '.join(available_types)}"
+            }
+        else:
+            return {
+                "error": f"Component '{component_name}' not found in SVN path database",
+                "suggestion": "Please check the component name or add it to the svn_path table"
+            }
     
     def list_all_mappings(self, component_name: str = None) -> Dict[str, Any]:
         """List all SVN path mappings, optionally filtered by component
@@ -644,29 +845,8 @@ class SVNPathManager:
         Returns:
             Dictionary with all mappings or error message
         """
-        if not self._connect():
-            return {"error": "Could not connect to SVN Path database"}
-        
         try:
-            cursor = self.connection.cursor()
-            
-            if component_name:
-                query = """
-                SELECT component_name, key, value 
-                FROM svn_path
-                WHERE component_name = ?
-                ORDER BY component_name, key
-                """
-                cursor.execute(query, (component_name,))
-            else:
-                query = """
-                SELECT component_name, key, value 
-                FROM svn_path
-                ORDER BY component_name, key
-                """
-                cursor.execute(query)
-            
-            results = cursor.fetchall()
+            results = self._lookup_mappings(component_name or None)
             
             if results:
                 mappings = []
@@ -687,45 +867,96 @@ class SVNPathManager:
                     "error": f"No mappings found" + (f" for component '{component_name}'" if component_name else ""),
                     "total_mappings": 0
                 }
+        except ConnectionError as e:
+            return {"error": str(e)}
         except Exception as e:
             logger.error(f"Error in list_all_mappings: {str(e)}")
             return {"error": f"Database error: {str(e)}"}
-        finally:
-            self._disconnect()
 
 
 # ============================================================
 # JIRA KNOWLEDGE BASE
 # ============================================================
-class JiraKnowledgeBase:
+# prompt_type -> (response key, jira_tmp_prompts result column) pairs
+_PROMPT_COLUMNS: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    'analysis': (('analysis_prompt', 1),),
+    'deployment': (('deployment_prompt', 2),),
+    'both': (('analysis_prompt', 1), ('deployment_prompt', 2)),
+}
+
+
+def _read_as_blob(value: Optional[str]) -> Optional[bytes]:
+    """Convert a string or file path to a BLOB value for the jira_prompts columns
+    
+    Existing files are read as UTF-8 text (so line endings are normalized) and
+    stored encoded; anything else is stored as the UTF-8 encoded string.
+    """
+    if not value:
+        return None
+    # Check if it's a file path
+    if isinstance(value, str) and os.path.isfile(value):
+        try:
+            with open(value, 'r', encoding='utf-8') as f:
+                return f.read().encode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            # If file read fails, use the string as-is
+            pass
+    return value.encode('utf-8')
+
+
+class JiraKnowledgeBase(SQLiteSessionMixin):
     """Jira Knowledge Base for similar requirement search"""
     
+    CONNECT_ERROR = "Could not connect to Jira Knowledge Base"
+    
     def __init__(self, db_path: str = JIRA_DASHBOARD_DB):
         self.db_path = db_path
         self.connection = None
-    
-    def _connect(self) -> bool:
-        try:
-            if not os.path.exists(self.db_path):
-                logger.error(f"Database file not found: {self.db_path}")
-                return False
-            # Use a timeout and check_same_thread=False for better concurrency
-            self.connection = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, isolation_level='DEFERRED')
-            # Enable WAL mode for better concurrent access
-            self.connection.execute("PRAGMA journal_mode=WAL")
-            self.connection.execute("PRAGMA synchronous=NORMAL")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to database {self.db_path}: {str(e)}")
-            return False
-    
-    def _disconnect(self):
-        if self.connection:
-            try:
-                self.connection.close()
-            except:
-                pass
-            self.connection = None
+        # (normalized text, limit) -> (monotonic timestamp, rows), oldest entry first
+        self._similar_cache: Dict[Tuple[str, int], Tuple[float, Tuple[Dict[str, Any], ...]]] = {}
+    
+    def _similar_impl(self, search_text: str, limit: int) -> Tuple[Dict[str, Any], ...]:
+        """Query jira_kb for rows matching search_text; memoized via _similar_cached"""
+        with self._session() as cursor:
+            # LIKE is already case-insensitive for ASCII, so the pattern is built
+            # once here and bound a single time as ?1 instead of lower()-ing per row
+            query = """
+            SELECT Jira_ID, Module, Requirement_Description, Solution_Summary, Key_Objects
+            FROM jira_kb
+            WHERE Module LIKE ?1
+               OR Requirement_Description LIKE ?1
+               OR Solution_Summary LIKE ?1
+               OR Key_Objects LIKE ?1
+            LIMIT ?2
+            """
+            cursor.execute(query, (f"%{search_text}%", limit))
+            return tuple(
+                {
+                    "jira_id": row[0],
+                    "module": row[1],
+                    "requirement_description": row[2],
+                    "solution_summary": row[3],
+                    "key_objects": row[4]
+                }
+                for row in cursor.fetchall()
+            )
+    
+    def _similar_cached(self, search_text: str, limit: int) -> Tuple[Dict[str, Any], ...]:
+        """Rows for a search younger than JIRA_KB_CACHE_TTL, querying jira_kb on a miss"""
+        key = (search_text, limit)
+        cached = self._similar_cache.get(key)
+        if cached and time.monotonic() - cached[0] < JIRA_KB_CACHE_TTL:
+            return cached[1]
+        rows = self._similar_impl(search_text, limit)
+        self._similar_cache.pop(key, None)
+        self._similar_cache[key] = (time.monotonic(), rows)
+        if len(self._similar_cache) > JIRA_KB_CACHE_SIZE:
+            del self._similar_cache[next(iter(self._similar_cache))]
+        return rows
+    
+    def invalidate_similarity_cache(self):
+        """Forget memoized similarity searches (call after jira_kb changes)"""
+        self._similar_cache.clear()
     
     def get_similar_jira_entries(self, requirement_text: str, limit: int = 5) -> Dict[str, Any]:
         """
@@ -738,43 +969,18 @@ class JiraKnowledgeBase:
         Returns:
             Dictionary with search results or error message
         """
-        if not self._connect():
-            return {"error": "Could not connect to Jira Knowledge Base"}
-        
         try:
-            cursor = self.connection.cursor()
-            
-            query = """
-            SELECT Jira_ID, Module, Requirement_Description, Solution_Summary, Key_Objects
-            FROM jira_kb
-            WHERE lower(Module) LIKE '%' || lower(?) || '%'
-               OR lower(Requirement_Description) LIKE '%' || lower(?) || '%'
-               OR lower(Solution_Summary) LIKE '%' || lower(?) || '%'
-               OR lower(Key_Objects) LIKE '%' || lower(?) || '%'
-            LIMIT ?
-            """
-            cursor.execute(query, (requirement_text, requirement_text, requirement_text, requirement_text, limit))
-            results = cursor.fetchall()
-            
-            formatted = []
-            for row in results:
-                formatted.append({
-                    "jira_id": row[0],
-                    "module": row[1],
-                    "requirement_description": row[2],
-                    "solution_summary": row[3],
-                    "key_objects": row[4]
-                })
-            
+            # Copies, so callers cannot alter the cached rows
+            formatted = [dict(row) for row in self._similar_cached(requirement_text.strip().lower(), limit)]
             return {
                 "search_query": requirement_text,
                 "results_count": len(formatted),
                 "results": formatted
             }
+        except ConnectionError as e:
+            return {"error": str(e)}
         except Exception as e:
             return {"error": f"Error searching Jira KB: {str(e)}"}
-        finally:
-            self._disconnect()
     
     def get_latest_tmp_prompt(self, jira_number: str, prompt_type: str = "analysis") -> Dict[str, Any]:
         """
@@ -787,49 +993,40 @@ class JiraKnowledgeBase:
         Returns:
             Dictionary with the latest prompt data or error message
         """
-        if not self._connect():
-            return {"error": "Could not connect to Jira Knowledge Base"}
+        # Validate prompt_type
+        pt = prompt_type.casefold()
+        if pt not in _PROMPT_COLUMNS:
+            return {"error": f"Invalid prompt_type '{prompt_type}'. Must be one of: {', '.join(_PROMPT_COLUMNS)}"}
         
         try:
-            cursor = self.connection.cursor()
-            
-            # Validate prompt_type
-            valid_types = ['analysis', 'deployment', 'both']
-            if prompt_type.lower() not in valid_types:
-                return {"error": f"Invalid prompt_type '{prompt_type}'. Must be one of: {', '.join(valid_types)}"}
-            
-            query = """
-            SELECT jira_no, analysis_prompt, deployment_prompt
-            FROM jira_tmp_prompts
-            WHERE jira_no = ?
-            ORDER BY rowid DESC
-            LIMIT 1
-            """
-            cursor.execute(query, (jira_number,))
-            result = cursor.fetchone()
-            
-            if result:
-                response = {
-                    "jira_number": result[0],
-                    "created_at": None  # No created_at column in this table
-                }
-                
-                # Add requested prompt(s) based on prompt_type
-                if prompt_type.lower() == 'analysis':
-                    response["analysis_prompt"] = result[1]
-                elif prompt_type.lower() == 'deployment':
-                    response["deployment_prompt"] = result[2]
-                else:  # both
-                    response["analysis_prompt"] = result[1]
-                    response["deployment_prompt"] = result[2]
+            with self._session() as cursor:
+                query = """
+                SELECT jira_no, analysis_prompt, deployment_prompt
+                FROM jira_tmp_prompts
+                WHERE jira_no = ?
+                ORDER BY rowid DESC
+                LIMIT 1
+                """
+                cursor.execute(query, (jira_number,))
+                result = cursor.fetchone()
                 
-                return response
-            else:
-                return {"error": f"No records found for {jira_number} in jira_tmp_prompts table"}
+                if result:
+                    response = {
+                        "jira_number": result[0],
+                        "created_at": None  # No created_at column in this table
+                    }
+                    
+                    # Add requested prompt(s) based on prompt_type
+                    for key, column in _PROMPT_COLUMNS[pt]:
+                        response[key] = result[column]
+                    
+                    return response
+                else:
+                    return {"error": f"No records found for {jira_number} in jira_tmp_prompts table"}
+        except ConnectionError as e:
+            return {"error": str(e)}
         except Exception as e:
             return {"error": f"Error fetching tmp prompt: {str(e)}"}
-        finally:
-            self._disconnect()
     
     def get_jira_prompt(self, jira_number: str) -> Dict[str, Any]:
         """
@@ -841,40 +1038,36 @@ class JiraKnowledgeBase:
         Returns:
             Dictionary with prompt data or error message
         """
-        if not self._connect():
-            return {"error": "Could not connect to Jira Knowledge Base"}
-        
         try:
-            cursor = self.connection.cursor()
-            
-            query = """
-            SELECT p_id, jira_number, category, analysis_prompt, gen_code, 
-                   gen_test_case, deployment_prompt, rewards
-            FROM jira_prompts
-            WHERE jira_number = ?
-            ORDER BY p_id DESC
-            LIMIT 1
-            """
-            cursor.execute(query, (jira_number,))
-            result = cursor.fetchone()
-            
-            if result:
-                return {
-                    "p_id": result[0],
-                    "jira_number": result[1],
-                    "category": result[2],
-                    "analysis_prompt": result[3].decode('utf-8') if result[3] else None,
-                    "gen_code": result[4].decode('utf-8') if result[4] else None,
-                    "gen_test_case": result[5].decode('utf-8') if result[5] else None,
-                    "deployment_prompt": result[6].decode('utf-8') if result[6] else None,
-                    "rewards": result[7]
-                }
-            else:
-                return {"error": f"No records found for {jira_number} in jira_prompts table"}
+            with self._session() as cursor:
+                query = """
+                SELECT p_id, jira_number, category, analysis_prompt, gen_code, 
+                       gen_test_case, deployment_prompt, rewards
+                FROM jira_prompts
+                WHERE jira_number = ?
+                ORDER BY p_id DESC
+                LIMIT 1
+                """
+                cursor.execute(query, (jira_number,))
+                result = cursor.fetchone()
+                
+                if result:
+                    return {
+                        "p_id": result[0],
+                        "jira_number": result[1],
+                        "category": result[2],
+                        "analysis_prompt": result[3].decode('utf-8') if result[3] else None,
+                        "gen_code": result[4].decode('utf-8') if result[4] else None,
+                        "gen_test_case": result[5].decode('utf-8') if result[5] else None,
+                        "deployment_prompt": result[6].decode('utf-8') if result[6] else None,
+                        "rewards": result[7]
+                    }
+                else:
+                    return {"error": f"No records found for {jira_number} in jira_prompts table"}
+        except ConnectionError as e:
+            return {"error": str(e)}
         except Exception as e:
             return {"error": f"Error fetching jira prompt: {str(e)}"}
-        finally:
-            self._disconnect()
     
     def insert_jira_prompt(self, jira_number: str, category: str = None, 
                           analysis_prompt: str = None, gen_code: str = None,
@@ -895,61 +1088,37 @@ class JiraKnowledgeBase:
         Returns:
             Success message with inserted ID or error
         """
-        if not self._connect():
-            return {"error": "Could not connect to Jira Knowledge Base"}
-        
         try:
-            cursor = self.connection.cursor()
-            
-            # Helper function to read file content if path is provided, otherwise use the string
-            def get_content(value):
-                if not value:
-                    return None
-                # Check if it's a file path
-                if isinstance(value, str) and (os.path.exists(value) or '\\' in value or '/' in value):
-                    if os.path.exists(value):
-                        try:
-                            with open(value, 'r', encoding='utf-8') as f:
-                                return f.read().encode('utf-8')
-                        except:
-                            # If file read fails, use the string as-is
-                            return value.encode('utf-8')
-                    else:
-                        # File path doesn't exist, use as string
-                        return value.encode('utf-8')
-                # Not a file path, treat as string content
-                return value.encode('utf-8')
-            
-            # Convert strings/file paths to BLOB (bytes) for BLOB columns
-            analysis_blob = get_content(analysis_prompt)
-            code_blob = get_content(gen_code)
-            test_blob = get_content(gen_test_case)
-            deployment_blob = get_content(deployment_prompt)
-            
-            query = """
-            INSERT INTO jira_prompts (jira_number, category, analysis_prompt, gen_code,
-                                     gen_test_case, deployment_prompt, rewards)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            cursor.execute(query, (jira_number, category, analysis_blob, code_blob,
-                                  test_blob, deployment_blob, rewards))
-            
-            self.connection.commit()
-            inserted_id = cursor.lastrowid
-            
-            return {
-                "status": "success",
-                "message": f"Successfully inserted prompt for {jira_number}",
-                "p_id": inserted_id
-            }
+            with self._session() as cursor:
+                # Convert strings/file paths to BLOB (bytes) for BLOB columns
+                analysis_blob = _read_as_blob(analysis_prompt)
+                code_blob = _read_as_blob(gen_code)
+                test_blob = _read_as_blob(gen_test_case)
+                deployment_blob = _read_as_blob(deployment_prompt)
+                
+                query = """
+                INSERT INTO jira_prompts (jira_number, category, analysis_prompt, gen_code,
+                                         gen_test_case, deployment_prompt, rewards)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """
+                cursor.execute(query, (jira_number, category, analysis_blob, code_blob,
+                                      test_blob, deployment_blob, rewards))
+                
+                inserted_id = cursor.lastrowid
+                
+                return {
+                    "status": "success",
+                    "message": f"Successfully inserted prompt for {jira_number}",
+                    "p_id": inserted_id
+                }
+        except ConnectionError as e:
+            return {"error": str(e)}
         except sqlite3.Error as e:
             logger.error(f"SQLite error in insert_jira_prompt: {str(e)}")
             return {"error": f"Database error: {str(e)}"}
         except Exception as e:
             logger.error(f"Error in insert_jira_prompt: {str(e)}\n{traceback.format_exc()}")
             return {"error": f"Error inserting jira prompt: {str(e)}"}
-        finally:
-            self._disconnect()
     
     def update_jira_prompt(self, jira_number: str, category: str = None,
                           analysis_prompt: str = None, gen_code: str = None,
@@ -970,97 +1139,114 @@ class JiraKnowledgeBase:
         Returns:
             Success message or error
         """
-        if not self._connect():
-            return {"error": "Could not connect to Jira Knowledge Base"}
-        
         try:
-            cursor = self.connection.cursor()
-            
-            # Helper function to read file content if path is provided, otherwise use the string
-            def get_content(value):
-                if not value:
-                    return None
-                # Check if it's a file path
-                if isinstance(value, str) and (os.path.exists(value) or '\\' in value or '/' in value):
-                    if os.path.exists(value):
-                        try:
-                            with open(value, 'r', encoding='utf-8') as f:
-                                return f.read().encode('utf-8')
-                        except:
-                            # If file read fails, use the string as-is
-                            return value.encode('utf-8')
-                    else:
-                        # File path doesn't exist, use as string
-                        return value.encode('utf-8')
-                # Not a file path, treat as string content
-                return value.encode('utf-8')
-            
-            # Build dynamic UPDATE query based on provided fields
-            update_fields = []
-            update_values = []
-            
-            if category is not None:
-                update_fields.append("category = ?")
-                update_values.append(category)
-            
-            if analysis_prompt is not None:
-                update_fields.append("analysis_prompt = ?")
-                update_values.append(get_content(analysis_prompt))
-            
-            if gen_code is not None:
-                update_fields.append("gen_code = ?")
-                update_values.append(get_content(gen_code))
-            
-            if gen_test_case is not None:
-                update_fields.append("gen_test_case = ?")
-                update_values.append(get_content(gen_test_case))
-            
-            if deployment_prompt is not None:
-                update_fields.append("deployment_prompt = ?")
-                update_values.append(get_content(deployment_prompt))
-            
-            if rewards is not None:
-                update_fields.append("rewards = ?")
-                update_values.append(rewards)
-            
-            if not update_fields:
-                return {"error": "No fields provided to update"}
-            
-            # Get the latest p_id for this jira_number
-            cursor.execute("SELECT p_id FROM jira_prompts WHERE jira_number = ? ORDER BY p_id DESC LIMIT 1", 
-                          (jira_number,))
-            result = cursor.fetchone()
-            
-            if not result:
-                return {"error": f"No existing record found for {jira_number}. Use insert instead."}
-            
-            p_id = result[0]
-            update_values.append(p_id)
-            
-            query = f"UPDATE jira_prompts SET {', '.join(update_fields)} WHERE p_id = ?"
-            cursor.execute(query, update_values)
-            
-            self.connection.commit()
-            
-            return {
-                "status": "success",
-                "message": f"Successfully updated prompt for {jira_number}",
-                "p_id": p_id,
-                "updated_fields": len(update_fields)
-            }
+            with self._session() as cursor:
+                # Build dynamic UPDATE query based on provided fields
+                update_fields = []
+                update_values = []
+                
+                if category is not None:
+                    update_fields.append("category = ?")
+                    update_values.append(category)
+                
+                if analysis_prompt is not None:
+                    update_fields.append("analysis_prompt = ?")
+                    update_values.append(_read_as_blob(analysis_prompt))
+                
+                if gen_code is not None:
+                    update_fields.append("gen_code = ?")
+                    update_values.append(_read_as_blob(gen_code))
+                
+                if gen_test_case is not None:
+                    update_fields.append("gen_test_case = ?")
+                    update_values.append(_read_as_blob(gen_test_case))
+                
+                if deployment_prompt is not None:
+                    update_fields.append("deployment_prompt = ?")
+                    update_values.append(_read_as_blob(deployment_prompt))
+                
+                if rewards is not None:
+                    update_fields.append("rewards = ?")
+                    update_values.append(rewards)
+                
+                if not update_fields:
+                    return {"error": "No fields provided to update"}
+                
+                # Get the latest p_id for this jira_number
+                cursor.execute("SELECT p_id FROM jira_prompts WHERE jira_number = ? ORDER BY p_id DESC LIMIT 1", 
+                              (jira_number,))
+                result = cursor.fetchone()
+                
+                if not result:
+                    return {"error": f"No existing record found for {jira_number}. Use insert instead."}
+                
+                p_id = result[0]
+                update_values.append(p_id)
+                
+                query = f"UPDATE jira_prompts SET {', '.join(update_fields)} WHERE p_id = ?"
+                cursor.execute(query, update_values)
+                
+                return {
+                    "status": "success",
+                    "message": f"Successfully updated prompt for {jira_number}",
+                    "p_id": p_id,
+                    "updated_fields": len(update_fields)
+                }
+        except ConnectionError as e:
+            return {"error": str(e)}
         except sqlite3.Error as e:
             logger.error(f"SQLite error in update_jira_prompt: {str(e)}")
             return {"error": f"Database error: {str(e)}"}
         except Exception as e:
             logger.error(f"Error in update_jira_prompt: {str(e)}\n{traceback.format_exc()}")
             return {"error": f"Error updating jira prompt: {str(e)}"}
-        finally:
-            self._disconnect()
 
 
 # ============================================================
 # SVN CLIENT
 # ============================================================
+SVN_CAT_CONCURRENCY = 8  # parallel per-file cats; keeps the SVN server from being flooded
+SVN_LISTING_TTL = 30  # seconds a parent directory listing is reused by commit_file
+SVN_INFO_TTL = 60  # seconds svn info/log results are reused
+SVN_WC_ROOT = os.path.join(os.path.expanduser('~'), '.devmind', 'svn-wc')
+_INFO_RE = re.compile(r'^(Revision|Last Changed Rev|Last Changed Author|Last Changed Date):[ \t]*(.*)$', re.M)
+_REV_RE = re.compile(r'Committed revision (\d+)')
+_cleanup_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="svn-cleanup")
+
+
+@contextmanager
+def _interprocess_lock(lock_path: str):
+    """Hold an exclusive lock on lock_path, shared with every other process
+    
+    Each VS Code window runs its own MCP server, so a threading.Lock alone does
+    not keep two servers out of the same working copy.
+    """
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, 'a+b') as f:
+        if sys.platform == 'win32':
+            import msvcrt
+            f.seek(0)
+            # LK_LOCK gives up after ten seconds; keep waiting like flock does
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 class SVNClient:
     """SVN client for source control operations"""
     
@@ -1069,17 +1255,32 @@ class SVNClient:
         self.base_url = credentials.get_svn_base_url()
         self.username = credentials.get_svn_username()
         self.password = credentials.get_svn_password()
+        # Credential and non-interactive flags appended to every svn invocation
+        self._svn_flags: Tuple[str, ...] = (
+            *(("--username", self.username) if self.username else ()),
+            *(("--password", self.password) if self.password else ()),
+            "--trust-server-cert-failures=unknown-ca,cn-mismatch,expired,not-yet-valid,other",
+            "--non-interactive",
+        )
+        self._info_cache: Dict[Tuple[str, ...], Tuple[float, Tuple[bool, str]]] = {}
+        self._wc_locks: Dict[str, threading.Lock] = {}
+        self._wc_locks_guard = threading.Lock()
     
-    def _run_svn_command(self, command: list[str]) -> tuple[bool, str]:
-        """Execute SVN command"""
+    def _build_svn_command(self, command: list[str]) -> Tuple[str, ...]:
+        """Build the full svn argv with credentials and non-interactive flags"""
+        return ("svn", *command, *self._svn_flags)
+    
+    def _run_svn_command(self, command: list[str], check_only: bool = False) -> tuple[bool, str]:
+        """Execute SVN command
+        
+        With check_only=True the output is discarded and only success is reported.
+        """
         try:
-            full_command = ["svn"] + command
-            if self.username:
-                full_command.extend(["--username", self.username])
-            if self.password:
-                full_command.extend(["--password", self.password])
-            full_command.append("--trust-server-cert-failures=unknown-ca,cn-mismatch,expired,not-yet-valid,other")
-            full_command.append("--non-interactive")
+            full_command = self._build_svn_command(command)
+            
+            if check_only:
+                result = subprocess.run(full_command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=DEFAULT_SVN_TIMEOUT)
+                return result.returncode == 0, ""
             
             result = subprocess.run(full_command, capture_output=True, text=True, timeout=DEFAULT_SVN_TIMEOUT, encoding='utf-8')
             
@@ -1090,159 +1291,245 @@ class SVNClient:
         except Exception as e:
             return False, str(e)
     
-    def update_component(self, component: str) -> tuple[bool, str]:
-        """Update specific component from SVN repository
-        
-        Note: This method is designed for local SVN working copies.
-        For remote repository access (browsing only), no update is needed.
-        """
+    async def _run_svn_command_async(self, command: list[str]) -> tuple[bool, str]:
+        """Execute SVN command as an asyncio subprocess"""
         try:
-            # Skip update for remote repository access - only needed for local working copies
-            # When browsing SVN remotely, we directly access the latest version via URL
-            return True, f"Using remote SVN access (no local update needed)"
+            proc = await asyncio.create_subprocess_exec(
+                *self._build_svn_command(command),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), DEFAULT_SVN_TIMEOUT)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return False, f"svn {command[0]} timed out after {DEFAULT_SVN_TIMEOUT} seconds"
+            
+            out = stdout.decode('utf-8', errors='replace').strip()
+            if proc.returncode == 0:
+                return True, out
+            else:
+                return False, stderr.decode('utf-8', errors='replace').strip() or out
         except Exception as e:
             return False, str(e)
     
+    def _cache_get(self, command: list[str], ttl: float) -> Optional[tuple[bool, str]]:
+        """Cached result for command if it is younger than ttl seconds"""
+        cached = self._info_cache.get(tuple(command))
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+    
+    def _cache_put(self, command: list[str], result: tuple[bool, str]) -> tuple[bool, str]:
+        """Remember a successful result for command and pass it through"""
+        if result[0]:
+            self._info_cache[tuple(command)] = (time.monotonic(), result)
+        return result
+    
+    def _cached_run(self, command: list[str], ttl: float) -> tuple[bool, str]:
+        """Run a read-only SVN command, reusing a successful result for ttl seconds"""
+        return self._cache_get(command, ttl) or self._cache_put(command, self._run_svn_command(command))
+    
+    async def _cached_run_async(self, command: list[str], ttl: float) -> tuple[bool, str]:
+        """Async counterpart of _cached_run sharing the same cache"""
+        return self._cache_get(command, ttl) or self._cache_put(command, await self._run_svn_command_async(command))
+    
+    def invalidate(self, component: str):
+        """Evict cached SVN results for the component URL and any URL under it"""
+        root = f"{self.base_url}/{component}"
+        prefixes = (root + "/", root + "@")  # children, and the root pinned to a revision
+        for key in [k for k in self._info_cache
+                    if any(arg == root or arg.startswith(prefixes) for arg in k)]:
+            del self._info_cache[key]
+    
+    def _list_parent(self, parent_url: str) -> frozenset:
+        """Names of the entries directly under parent_url, from one `svn ls --xml` call"""
+        success, output = self._cached_run(["ls", "--xml", parent_url], SVN_LISTING_TTL)
+        if not success:
+            return frozenset()
+        try:
+            return frozenset(name.text for name in ET.fromstring(output).iter('name') if name.text)
+        except ET.ParseError:
+            return frozenset()
+    
+    def _wc_lock(self, parent_url: str) -> threading.Lock:
+        """Lock serializing this process's commits that share a working copy"""
+        with self._wc_locks_guard:
+            return self._wc_locks.setdefault(parent_url, threading.Lock())
+    
+    @staticmethod
+    def _wc_path(parent_url: str) -> str:
+        """Location of the working copy for parent_url under SVN_WC_ROOT"""
+        return os.path.join(SVN_WC_ROOT, hashlib.blake2b(parent_url.encode('utf-8'), digest_size=8).hexdigest())
+    
+    def _wc_dir(self, parent_url: str) -> tuple[bool, str]:
+        """Persistent `--depth files` working copy of parent_url, brought up to date
+        
+        The first call checks the directory out under SVN_WC_ROOT; later calls revert
+        leftovers from earlier failed commits and run `svn update`. A working copy
+        that fails to update is checked out again. Callers hold both the
+        thread lock and the interprocess lock for the working copy.
+        
+        Returns:
+            (success, working copy path or error output)
+        """
+        wc_dir = self._wc_path(parent_url)
+        if os.path.isdir(os.path.join(wc_dir, '.svn')):
+            self._run_svn_command(["revert", "-R", wc_dir], check_only=True)
+            success, output = self._run_svn_command(["update", wc_dir])
+            if success:
+                return True, wc_dir
+            logger.warning(f"SVN update failed for {parent_url}, checking out again: {output}")
+            # Move the broken copy aside so the checkout does not wait for it to be deleted
+            stale_dir = f"{wc_dir}.stale-{time.monotonic_ns()}"
+            try:
+                os.replace(wc_dir, stale_dir)
+                _cleanup_pool.submit(shutil.rmtree, stale_dir, ignore_errors=True)
+            except OSError:
+                shutil.rmtree(wc_dir, ignore_errors=True)
+        
+        os.makedirs(wc_dir, exist_ok=True)
+        success, output = self._run_svn_command(["checkout", "--depth", "files", parent_url, wc_dir])
+        return (True, wc_dir) if success else (False, output)
+    
     def commit_file(self, component: str, file_path: str, file_content: str, 
                    svn_path: str, commit_message: str) -> tuple[bool, str, Optional[str]]:
         """Commit file to SVN"""
-        temp_dir = None
         try:
-            # Update component first
-            update_success, update_output = self.update_component(component)
-            update_info = f"📥 SVN Update: {component}\n{update_output}\n\n" if update_success else f"⚠️ Update Warning: {update_output}\n\n"
-            
-            temp_dir = tempfile.mkdtemp()
-            svn_url = f"{self.base_url}/{component}/{svn_path}"
-            parent_url = os.path.dirname(svn_url).replace('\\', '/')
+            # Windows-style separators would otherwise end up in the file name
+            svn_url = f"{self.base_url}/{component}/{svn_path}".replace('\\', '/')
+            parent_url, _, url_name = svn_url.rpartition('/')
             file_name = os.path.basename(file_path)
-            local_file = os.path.join(temp_dir, file_name)
             
-            success, output = self._run_svn_command(["info", svn_url])
-            file_exists = success
+            file_exists = url_name in self._list_parent(parent_url)
             
-            success, output = self._run_svn_command(["checkout", "--depth", "files", parent_url, temp_dir])
-            if not success:
-                return False, f"Failed to checkout: {output}", None
-            
-            with open(local_file, 'w', encoding='utf-8') as f:
-                f.write(file_content)
-            
-            if not file_exists:
-                success, output = self._run_svn_command(["add", local_file])
+            with self._wc_lock(parent_url), _interprocess_lock(self._wc_path(parent_url) + ".lock"):
+                success, output = self._wc_dir(parent_url)
                 if not success:
-                    return False, f"Failed to add: {output}", None
-            
-            success, output = self._run_svn_command(["commit", "-m", commit_message, local_file])
-            if not success:
-                return False, f"{update_info}Failed to commit: {output}", None
+                    return False, f"Failed to checkout: {output}", None
+                local_file = os.path.join(output, file_name)
+                
+                with open(local_file, 'w', encoding='utf-8') as f:
+                    f.write(file_content)
+                
+                if not file_exists:
+                    # --force tolerates a file left scheduled for addition by an earlier failed commit
+                    success, output = self._run_svn_command(["add", "--force", local_file])
+                    if not success:
+                        return False, f"Failed to add: {output}", None
+                
+                success, output = self._run_svn_command(["commit", "-m", commit_message, local_file])
+                if not success:
+                    return False, f"Failed to commit: {output}", None
+                self.invalidate(component)
             
-            revision = None
-            if "Committed revision" in output:
-                try:
-                    revision = output.split("revision")[1].strip().rstrip('.').strip()
-                except:
-                    pass
+            match = _REV_RE.search(output)
+            revision = match.group(1) if match else None
             
-            return True, f"{update_info}✅ File committed successfully!\n{output}", revision
+            return True, f"✅ File committed successfully!\n{output}", revision
         except Exception as e:
             return False, str(e), None
-        finally:
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
     
-    def get_file_version(self, component: str, svn_path: str, limit: int = 1) -> tuple[bool, str]:
-        """Get file version info"""
+    async def get_file_version_async(self, component: str, svn_path: str, limit: int = 1) -> tuple[bool, str]:
+        """Get file version info without blocking the event loop (revision list; see
+        get_revision_detail_async for changed paths)"""
         try:
-            # Update component first
-            update_success, update_output = self.update_component(component)
-            update_info = f"📥 SVN Update: {component}\n{update_output}\n\n" if update_success else f"⚠️ Update Warning: {update_output}\n\n"
-            
             svn_url = f"{self.base_url}/{component}/{svn_path}"
-            success, output = self._run_svn_command(["log", "-l", str(limit), "-v", svn_url])
+            success, output = await self._cached_run_async(["log", "-l", str(limit), svn_url], SVN_INFO_TTL)
             if not success:
-                return False, f"{update_info}Failed to get version: {output}"
-            return True, f"{update_info}{output}"
+                return False, f"Failed to get version: {output}"
+            return True, output
         except Exception as e:
             return False, str(e)
     
-    def get_latest_version(self, component: str, directory_path: str = "trunk/DB") -> tuple[bool, str]:
-        """Get latest SVN version/revision for component directory"""
+    async def get_revision_detail_async(self, component: str, svn_path: str, revision: str) -> tuple[bool, str]:
+        """Get the log message and changed paths of a single revision without blocking the event loop"""
+        try:
+            svn_url = f"{self.base_url}/{component}/{svn_path}"
+            success, output = await self._cached_run_async(["log", "-r", str(revision), "-v", svn_url], SVN_INFO_TTL)
+            if not success:
+                return False, f"Failed to get revision {revision}: {output}"
+            return True, output
+        except Exception as e:
+            return False, str(e)
+    
+    async def get_latest_version_async(self, component: str, directory_path: str = "trunk/DB") -> tuple[bool, str]:
+        """Get latest SVN version/revision for component directory without blocking the event loop"""
         try:
-            # Update component first
-            update_success, update_output = self.update_component(component)
-            update_info = f"📥 SVN Update: {component}\n{update_output}\n\n" if update_success else f"⚠️ Update Warning: {update_output}\n\n"
-            
             svn_url = f"{self.base_url}/{component}/{directory_path}"
-            success, output = self._run_svn_command(["info", svn_url])
+            success, output = await self._cached_run_async(["info", svn_url], SVN_INFO_TTL)
             if not success:
-                return False, f"{update_info}Failed to get info: {output}"
+                return False, f"Failed to get info: {output}"
             
             # Parse the output to extract revision and last changed info
-            revision = "Unknown"
-            last_changed_rev = "Unknown"
-            last_changed_author = "Unknown"
-            last_changed_date = "Unknown"
-            
-            for line in output.split('\n'):
-                if line.startswith('Revision:'):
-                    revision = line.split(':', 1)[1].strip()
-                elif line.startswith('Last Changed Rev:'):
-                    last_changed_rev = line.split(':', 1)[1].strip()
-                elif line.startswith('Last Changed Author:'):
-                    last_changed_author = line.split(':', 1)[1].strip()
-                elif line.startswith('Last Changed Date:'):
-                    last_changed_date = line.split(':', 1)[1].strip()
-            
-            report = f"{update_info}📌 Latest Version Info: {component}/{directory_path}\n"
-            report += "=" * 70 + "\n"
-            report += f"Current Revision: {revision}\n"
-            report += f"Last Changed Revision: {last_changed_rev}\n"
-            report += f"Last Changed Author: {last_changed_author}\n"
-            report += f"Last Changed Date: {last_changed_date}\n"
-            report += "=" * 70 + "\n"
-            
-            return True, report
+            vals = {m.group(1): m.group(2).strip() for m in _INFO_RE.finditer(output)}
+            revision = vals.get('Revision', 'Unknown')
+            last_changed_rev = vals.get('Last Changed Rev', 'Unknown')
+            last_changed_author = vals.get('Last Changed Author', 'Unknown')
+            last_changed_date = vals.get('Last Changed Date', 'Unknown')
+            
+            parts = [
+                f"📌 Latest Version Info: {component}/{directory_path}\n",
+                "=" * 70 + "\n",
+                f"Current Revision: {revision}\n",
+                f"Last Changed Revision: {last_changed_rev}\n",
+                f"Last Changed Author: {last_changed_author}\n",
+                f"Last Changed Date: {last_changed_date}\n",
+                "=" * 70 + "\n",
+            ]
+            
+            return True, "".join(parts)
         except Exception as e:
             return False, str(e)
     
-    def analyze_directory_code(self, component: str, directory_path: str, 
-                               file_extensions: list[str] = None, max_files: int = 20) -> tuple[bool, str]:
-        """Analyze directory code"""
+    async def analyze_directory_code_async(self, component: str, directory_path: str,
+                                           file_extensions: list[str] = None, max_files: int = 20,
+                                           progress: Optional[Callable[[int, int], Awaitable[Any]]] = None) -> tuple[bool, str]:
+        """Analyze directory code without blocking the event loop
+        
+        When progress is given, it is awaited as progress(done, total) each time
+        a file has been fetched.
+        """
         try:
-            # Update component first
-            update_success, update_output = self.update_component(component)
-            update_info = f"📥 SVN Update: {component}\n{update_output}\n\n" if update_success else f"⚠️ Update Warning: {update_output}\n\n"
-            
             svn_url = f"{self.base_url}/{component}/{directory_path}"
-            success, listing = self._run_svn_command(["list", "-R", svn_url])
+            success, listing = await self._run_svn_command_async(["list", "-R", "--xml", svn_url])
             if not success:
-                return False, f"{update_info}Failed to list directory: {listing}"
-            
-            files = [f.strip() for f in listing.split('\n') if f.strip() and not f.endswith('/')]
-            if file_extensions:
-                files = [f for f in files if any(f.endswith(ext) for ext in file_extensions)]
-            
-            if max_files > 0:
-                files = files[:max_files]
-            
-            report = f"{update_info}🔍 Code Analysis: {component}/{directory_path}\n"
-            report += "=" * 80 + "\n\n"
-            
-            for idx, file_path in enumerate(files, 1):
-                file_url = f"{svn_url}/{file_path}"
-                success, content = self._run_svn_command(["cat", file_url])
+                return False, f"Failed to list directory: {listing}"
+            
+            # Stream-parse the listing and stop as soon as max_files matches are collected
+            ext_tuple = tuple(file_extensions) if file_extensions else ()
+            files = []
+            for _, elem in ET.iterparse(io.StringIO(listing), events=('end',)):
+                if elem.tag != 'entry':
+                    continue
+                name = elem.findtext('name')
+                if elem.get('kind') == 'file' and name and (not ext_tuple or name.endswith(ext_tuple)):
+                    files.append(name)
+                    if 0 < max_files <= len(files):
+                        break
+                elem.clear()
+            
+            parts = [f"🔍 Code Analysis: {component}/{directory_path}\n", DEFAULT_SECTION_SEPARATOR + "\n\n"]
+            
+            sem = asyncio.Semaphore(SVN_CAT_CONCURRENCY)
+            done = 0
+            
+            async def _cat(file_path):
+                nonlocal done
+                async with sem:
+                    result = await self._run_svn_command_async(["cat", f"{svn_url}/{file_path}"])
+                done += 1
+                if progress is not None:
+                    await progress(done, len(files))
+                return result
+            
+            contents = await asyncio.gather(*(_cat(file_path) for file_path in files))
+            for idx, (file_path, (success, content)) in enumerate(zip(files, contents), 1):
                 if success:
-                    report += f"\n📄 File {idx}: {file_path}\n"
-                    report += "-" * 80 + "\n"
-                    report += content + "\n"
-                    report += "=" * 80 + "\n"
+                    parts.append(f"\n📄 File {idx}: {file_path}\n{DEFAULT_SECTION_DIVIDER}\n{content}\n{DEFAULT_SECTION_SEPARATOR}\n")
             
-            return True, report
+            return True, "".join(parts)
         except Exception as e:
             return False, str(e)
 
@@ -1278,20 +1565,29 @@ def check_jira_auth() -> Optional[str]:
         return f"❌ Jira connection error: {str(e)}\n\nPlease verify:\n1. Credentials file exists at ~/.devmind/credentials.ini\n2. Base URL, username, and password are correct\n3. Network connectivity to Jira server"
 
 
+def _safe(data: Any, *keys: str, default: Any = 'Unknown') -> Any:
+    """Walk nested Jira dicts by key, returning default on the first missing or null level"""
+    for key in keys:
+        data = data.get(key) if isinstance(data, dict) else None
+        if data is None:
+            return default
+    return data
+
+
 def format_issue_summary(issue_data: Optional[Dict]) -> str:
     """Format Jira issue summary"""
     if not issue_data:
         return "No issue data"
     
-    fields = issue_data.get('fields', {})
+    fields = issue_data.get('fields') or {}
     return f"""
 {DEFAULT_ISSUE_SUMMARY_SEPARATOR}
 Issue: {issue_data.get('key', 'Unknown')}
 {DEFAULT_ISSUE_SUMMARY_SEPARATOR}
 Summary: {fields.get('summary', 'No summary')}
-Status: {fields.get('status', {}).get('name', 'Unknown')}
-Priority: {fields.get('priority', {}).get('name', 'Unknown')}
-Assignee: {fields.get('assignee', {}).get('displayName', 'Unassigned') if fields.get('assignee') else 'Unassigned'}
+Status: {_safe(fields, 'status', 'name')}
+Priority: {_safe(fields, 'priority', 'name')}
+Assignee: {_safe(fields, 'assignee', 'displayName', default='Unassigned')}
 Description: {fields.get('description', 'No description')}
 {DEFAULT_ISSUE_SUMMARY_SEPARATOR}
 """
@@ -1322,21 +1618,23 @@ def get_jira_issue(issue_key: str, format: str = "full") -> str:
     
     try:
         jira = get_jira_api()
-        issue_data = jira.get_issue(issue_key.strip())
+        # The summary view only shows a handful of fields, so skip the rest of the payload
+        fields = 'summary,status,assignee,priority' if format == "summary" else None
+        issue_data = jira.get_issue(issue_key.strip(), fields=fields)
         
         if not issue_data:
             return f"❌ Could not retrieve {issue_key}"
         
         # Handle different formats
         if format == "raw":
-            return json.dumps(issue_data, indent=2)
+            return _dumps(issue_data)
         elif format == "summary":
-            fields = issue_data.get('fields', {})
+            fields = issue_data.get('fields') or {}
             return f"""📋 Issue: {issue_data.get('key')}
 Title: {fields.get('summary')}
-Status: {fields.get('status', {}).get('name')}
-Assignee: {fields.get('assignee', {}).get('displayName', 'Unassigned') if fields.get('assignee') else 'Unassigned'}
-Priority: {fields.get('priority', {}).get('name')}"""
+Status: {_safe(fields, 'status', 'name', default=None)}
+Assignee: {_safe(fields, 'assignee', 'displayName', default='Unassigned')}
+Priority: {_safe(fields, 'priority', 'name', default=None)}"""
         else:  # default to 'full'
             return format_issue_summary(issue_data)
     except Exception as e:
@@ -1362,19 +1660,18 @@ def update_issue_status(issue_key: str, target_status: str, comment: str = None)
     
     try:
         jira = get_jira_api()
-        issue_data = jira.get_issue(issue_key.strip())
-        if not issue_data:
+        # Status and transitions from one fresh request, so the id matches the current status
+        transitions, current_status = jira.get_transitions_with_status(issue_key.strip())
+        if transitions is None:
             return f"❌ Could not find {issue_key}"
         
-        current_status = issue_data.get('fields', {}).get('status', {}).get('name', 'Unknown')
         if current_status.lower() == target_status.lower():
             return f"ℹ️ Issue {issue_key} is already in '{current_status}' status"
         
-        transition_id, transition_name = jira.find_transition_by_name(issue_key, target_status)
+        transition_id, transition_name = jira.find_transition_by_name(issue_key, target_status, transitions)
         if not transition_id:
-            # Get available transitions to help user
-            transitions = jira.get_transitions(issue_key)
-            available = [t.get('to', {}).get('name') for t in transitions] if transitions else []
+            # List the available transitions to help user
+            available = [t.get('to', {}).get('name') for t in transitions]
             return f"❌ No transition found from '{current_status}' to '{target_status}'\n\nAvailable transitions: {', '.join(available)}"
         
         if jira.transition_issue(issue_key, transition_id, comment):
@@ -1405,7 +1702,10 @@ def search_issues_by_assignee(assignee_name: str, max_results: int = 20, count_o
     try:
         jira = get_jira_api()
         jql = f'assignee = "{assignee_name}"'
-        results = jira.search_issues(jql, max_results if not count_only else 1)
+        if count_only:
+            results = jira.search_issues(jql, max_results=1, fields='*none')
+        else:
+            results = jira.search_issues(jql, max_results)
         if not results:
             return f"❌ Search failed"
         
@@ -1417,14 +1717,15 @@ def search_issues_by_assignee(assignee_name: str, max_results: int = 20, count_o
         
         # Full results mode
         issues = results.get('issues', [])
-        output = f"📋 Issues for {assignee_name}: {total} total\n{'='*60}\n"
+        parts = [f"📋 Issues for {assignee_name}: {total} total\n{'='*60}\n"]
         for issue in issues:
             key = issue.get('key')
-            summary = issue.get('fields', {}).get('summary')
-            status = issue.get('fields', {}).get('status', {}).get('name')
-            output += f"🔹 {key}: {summary}\n   Status: {status}\n"
+            fields = issue.get('fields') or {}
+            summary = fields.get('summary')
+            status = _safe(fields, 'status', 'name', default=None)
+            parts.append(f"🔹 {key}: {summary}\n   Status: {status}\n")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -1444,13 +1745,13 @@ def search_issues_by_jql(jql_query: str, max_results: int = 20) -> str:
             return "❌ Search failed"
         
         issues = results.get('issues', [])
-        output = f"📋 JQL Results: {len(issues)} issues\n{'='*60}\n"
+        parts = [f"📋 JQL Results: {len(issues)} issues\n{'='*60}\n"]
         for issue in issues:
             key = issue.get('key')
-            summary = issue.get('fields', {}).get('summary')
-            output += f"🔹 {key}: {summary}\n"
+            summary = _safe(issue, 'fields', 'summary', default=None)
+            parts.append(f"🔹 {key}: {summary}\n")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -1486,13 +1787,13 @@ def get_issue_comments(issue_key: str, max_comments: int = 10) -> str:
         if not comments:
             return f"💬 No comments for {issue_key}"
         
-        output = f"💬 Comments for {issue_key}:\n{'='*60}\n"
-        for idx, comment in enumerate(sorted(comments, key=lambda x: x.get('created', ''), reverse=True)[:max_comments], 1):
+        parts = [f"💬 Comments for {issue_key}:\n{'='*60}\n"]
+        for idx, comment in enumerate(heapq.nlargest(max_comments, comments, key=lambda x: x.get('created', '')), 1):
             author = comment.get('author', {}).get('displayName', 'Unknown')
             body = comment.get('body', '')
-            output += f"{idx}. {author}: {body}\n"
+            parts.append(f"{idx}. {author}: {body}\n")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -1624,18 +1925,14 @@ def add_to_jira_kb(
         Success or error message
     """
     try:
-        conn = sqlite3.connect(JIRA_DASHBOARD_DB)
-        cur = conn.cursor()
-        
-        # Insert into jira_kb table
-        cur.execute("""
-            INSERT INTO jira_kb (jira_id, project_name, module, requirement_description,
-                                 solution_summary, key_objects, code_snippet)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (jira_id, project, module, description, solution, key_objects, code))
-        
-        conn.commit()
-        conn.close()
+        with jira_kb._session() as cursor:
+            # Insert into jira_kb table
+            cursor.execute("""
+                INSERT INTO jira_kb (jira_id, project_name, module, requirement_description,
+                                     solution_summary, key_objects, code_snippet)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (jira_id, project, module, description, solution, key_objects, code))
+        jira_kb.invalidate_similarity_cache()
         
         return f"✅ Successfully added {jira_id} to knowledge base\n📚 Project: {project}\n📦 Module: {module}"
     except sqlite3.IntegrityError:
@@ -1793,7 +2090,7 @@ def analyze_oracle_standards(requirement: str = None) -> str:
     """Analyze Oracle development standards"""
     try:
         result = oracle_kb.analyze_standards(requirement)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -1825,7 +2122,7 @@ def add_or_update_jira_dashboard(
             decision=decision,
             status=status
         )
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -1853,17 +2150,36 @@ def commit_file_to_svn(
 
 
 @mcp.tool()
-def get_committed_file_version(component: str, svn_path: str, history_limit: int = 5) -> str:
-    """Get file version and history"""
+async def get_committed_file_version(component: str, svn_path: str, history_limit: int = 5) -> str:
+    """Get file version and history (use get_revision_detail for a revision's changed paths)"""
     try:
-        success, info = svn_client.get_file_version(component, svn_path, history_limit)
+        success, info = await svn_client.get_file_version_async(component, svn_path, history_limit)
         return info
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
-def get_latest_component_version(
+async def get_revision_detail(component: str, svn_path: str, revision: str) -> str:
+    """Get the log message and changed paths of one revision of a file
+    
+    Args:
+        component: Component name (e.g., 'FZGDPR')
+        svn_path: File path inside the component (e.g., 'trunk/DB/table.sql')
+        revision: Revision number as listed by get_committed_file_version
+    
+    Returns:
+        svn log -v output for that revision
+    """
+    try:
+        success, detail = await svn_client.get_revision_detail_async(component, svn_path, revision.lstrip('r'))
+        return detail
+    except Exception as e:
+        return f"❌ Error: {str(e)}"
+
+
+@mcp.tool()
+async def get_latest_component_version(
     component: str,
     repo_path: str = "trunk",
     db_subdirectory: str = ""
@@ -1871,24 +2187,28 @@ def get_latest_component_version(
     """Get latest SVN version/revision of component DB directory (fast, no code analysis)"""
     try:
         directory_path = f"{repo_path}/DB/{db_subdirectory}" if db_subdirectory else f"{repo_path}/DB"
-        success, version_info = svn_client.get_latest_version(component, directory_path)
+        success, version_info = await svn_client.get_latest_version_async(component, directory_path)
         return version_info
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
 @mcp.tool()
-def analyze_db_code_logic(
+async def analyze_db_code_logic(
     component: str,
     repo_path: str = "trunk",
     db_subdirectory: str = "",
-    max_files: int = 0
+    max_files: int = 0,
+    ctx: Context = None
 ) -> str:
     """Analyze database code logic"""
     try:
         directory_path = f"{repo_path}/DB/{db_subdirectory}" if db_subdirectory else f"{repo_path}/DB"
-        success, analysis = svn_client.analyze_directory_code(
-            component, directory_path, file_extensions=['.sql', '.SQL'], max_files=max_files
+        # The listing and the cats run as subprocesses on this loop; progress is
+        # reported to the client as each file arrives
+        success, analysis = await svn_client.analyze_directory_code_async(
+            component, directory_path, file_extensions=['.sql', '.SQL'], max_files=max_files,
+            progress=ctx.report_progress if ctx is not None else None
         )
         return analysis
     except Exception as e:
@@ -1933,35 +2253,35 @@ def get_svn_path_for_requirement(component_name: str, requirement_type: str) ->
         result = svn_path_manager.get_svn_path(component_name, requirement_type)
         
         if "error" in result:
-            output = f"❌ {result['error']}\n"
+            parts = [f"❌ {result['error']}\n"]
             if "available_types" in result:
-                output += f"\n📋 Available requirement types for '{component_name}':\n"
-                for req_type in result['available_types']:
-                    output += f"  • {req_type}\n"
+                parts.append(f"\n📋 Available requirement types for '{component_name}':\n")
+                parts.extend(f"  • {req_type}\n" for req_type in result['available_types'])
             if "suggestion" in result:
-                output += f"\n💡 {result['suggestion']}\n"
-            return output
+                parts.append(f"\n💡 {result['suggestion']}\n")
+            return "".join(parts)
         
         # Handle multi-path results (e.g., package_creation with spec and body)
         if result.get('is_multi_path'):
-            output = f"📂 SVN Paths for {result['component_name']} - {result['requirement_type']}\n"
-            output += "=" * 80 + "\n"
-            output += f"⚠️ This requirement type has multiple paths:\n\n"
-            for idx, path in enumerate(result['svn_paths'], 1):
-                output += f"{idx}. {path}\n"
-            output += "\n" + "=" * 80 + "\n"
-            output += "🔗 Full URLs:\n"
-            for idx, full_path in enumerate(result['full_paths'], 1):
-                output += f"{idx}. {full_path}\n"
-            return output
+            parts = [
+                f"📂 SVN Paths for {result['component_name']} - {result['requirement_type']}\n",
+                DEFAULT_SECTION_SEPARATOR + "\n",
+                f"⚠️ This requirement type has multiple paths:\n\n",
+            ]
+            parts.extend(f"{idx}. {path}\n" for idx, path in enumerate(result['svn_paths'], 1))
+            parts.append("\n" + DEFAULT_SECTION_SEPARATOR + "\n")
+            parts.append("🔗 Full URLs:\n")
+            parts.extend(f"{idx}. {full_path}\n" for idx, full_path in enumerate(result['full_paths'], 1))
+            return "".join(parts)
         else:
             # Single path result
-            output = f"📂 SVN Path for {result['component_name']} - {result['requirement_type']}\n"
-            output += "=" * 80 + "\n"
-            output += f"📁 Path: {result['svn_path']}\n"
-            output += f"🔗 Full URL: {result['full_path']}\n"
-            output += "=" * 80 + "\n"
-            return output
+            return "".join([
+                f"📂 SVN Path for {result['component_name']} - {result['requirement_type']}\n",
+                DEFAULT_SECTION_SEPARATOR + "\n",
+                f"📁 Path: {result['svn_path']}\n",
+                f"🔗 Full URL: {result['full_path']}\n",
+                DEFAULT_SECTION_SEPARATOR + "\n",
+            ])
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -1990,23 +2310,42 @@ def list_svn_path_mappings(component_name: str = None) -> str:
         if "error" in result:
             return f"❌ {result['error']}"
         
-        output = f"📋 SVN Path Mappings - {result['filter'].upper()}\n"
-        output += "=" * 80 + "\n"
-        output += f"Total Mappings: {result['total_mappings']}\n"
-        output += "=" * 80 + "\n\n"
+        parts = [
+            f"📋 SVN Path Mappings - {result['filter'].upper()}\n",
+            DEFAULT_SECTION_SEPARATOR + "\n",
+            f"Total Mappings: {result['total_mappings']}\n",
+            DEFAULT_SECTION_SEPARATOR + "\n\n",
+        ]
         
         current_component = None
         for mapping in result['mappings']:
             if mapping['component'] != current_component:
                 if current_component is not None:
-                    output += "\n"
+                    parts.append("\n")
                 current_component = mapping['component']
-                output += f"🔷 Component: {mapping['component']}\n"
-                output += "-" * 80 + "\n"
+                parts.append(f"🔷 Component: {mapping['component']}\n")
+                parts.append(DEFAULT_SECTION_DIVIDER + "\n")
             
-            output += f"  📌 {mapping['requirement_type']:<25} → {mapping['svn_path']}\n"
+            parts.append(f"  📌 {mapping['requirement_type']:<25} → {mapping['svn_path']}\n")
         
-        return output
+        return "".join(parts)
+    except Exception as e:
+        return f"❌ Error: {str(e)}"
+
+
+@mcp.tool()
+def reload_svn_paths() -> str:
+    """Reload SVN path mappings from the database
+    
+    Mappings are loaded into memory once and served without touching SQLite.
+    Call this after editing the svn_path table to pick up the changes immediately.
+    
+    Returns:
+        Number of mappings loaded or error message
+    """
+    try:
+        count = svn_path_manager.reload()
+        return f"✅ Reloaded {count} SVN path mappings"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -2026,7 +2365,7 @@ def count_issues_by_assignee(assignee_name: str) -> str:
     try:
         jira = get_jira_api()
         jql = f'assignee = "{assignee_name}"'
-        results = jira.search_issues(jql, max_results=1)
+        results = jira.search_issues(jql, max_results=1, fields='*none')
         if not results:
             return "❌ Search failed"
         
@@ -2047,7 +2386,7 @@ def get_jira_issue_raw(issue_key: str) -> str:
     try:
         jira = get_jira_api()
         issue_data = jira.get_issue(issue_key.strip())
-        return json.dumps(issue_data, indent=2) if issue_data else f"❌ Could not retrieve {issue_key}"
+        return _dumps(issue_data) if issue_data else f"❌ Could not retrieve {issue_key}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
@@ -2090,20 +2429,21 @@ def get_issue_transitions(issue_key: str, detailed: bool = False) -> str:
     
     try:
         jira = get_jira_api()
-        transitions = jira.get_transitions(issue_key.strip())
-        if not transitions:
-            return f"❌ No transitions found for {issue_key}"
         
         # Detailed format
         if detailed:
+            transitions = jira.get_transitions(issue_key.strip())
+            if not transitions:
+                return f"❌ No transitions found for {issue_key}"
             output = f"🔄 Transitions for {issue_key}:\n{'='*50}\n"
             for t in transitions:
                 output += f"ID: {t.get('id')} | {t.get('name')} → {t.get('to', {}).get('name')}\n"
             return output
         
-        # Simple format
-        issue_data = jira.get_issue(issue_key.strip())
-        current_status = issue_data.get('fields', {}).get('status', {}).get('name', 'Unknown') if issue_data else 'Unknown'
+        # Simple format: transitions and current status come back from one request
+        transitions, current_status = jira.get_transitions_with_status(issue_key.strip())
+        if not transitions:
+            return f"❌ No transitions found for {issue_key}"
         output = f"📋 {issue_key} - Current: {current_status}\nAvailable transitions:\n"
         for idx, t in enumerate(transitions, 1):
             output += f"{idx}. {t.get('to', {}).get('name')}\n"
@@ -2112,12 +2452,36 @@ def get_issue_transitions(issue_key: str, detailed: bool = False) -> str:
         return f"❌ Error: {str(e)}"
 
 
+@mcp.tool()
+def jira_cache_clear() -> str:
+    """Clear cached Jira user info and issue transitions
+    
+    User info and transitions are reused for up to a minute. Call this after
+    changing an issue's workflow outside this server to fetch fresh data.
+    
+    Returns:
+        Confirmation message
+    """
+    try:
+        if jira_api is not None:
+            jira_api.clear_cache()
+        return "✅ Jira cache cleared"
+    except Exception as e:
+        return f"❌ Error: {str(e)}"
+
+
 # ============================================================
 # RUN SERVER
 # ============================================================
 
 if __name__ == "__main__":
-    logger.info("🚀 Starting DevMind Unified MCP Server")
-    logger.info("📦 Tools: 21 (Jira: 13, Oracle: 2, SVN: 4, SVN Path: 2)")
-    logger.info("✨ Optimized and consolidated for production use")
+    logger.info("\n".join([
+        "🚀 Starting DevMind Unified MCP Server",
+        "📦 Tools: 28 (Jira: 18, Oracle: 2, SVN: 5, SVN Path: 3)",
+        "✨ Optimized and consolidated for production use",
+    ]))
+    try:
+        logger.info(f"📂 Loaded {svn_path_manager.reload()} SVN path mappings")
+    except Exception as e:
+        logger.warning(f"SVN path mappings not preloaded, will load on first use: {e}")
     mcp.run()
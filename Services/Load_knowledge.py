@@ -1,16 +1,21 @@
-import pandas as pd
 import sqlite3
 
+from openpyxl import load_workbook
+
+from db import tune
+
 # Excel and SQLite paths
 excel_file = "DevMind_JiraKnowledge_2025.xlsx"
 sqlite_db = r"Z:\mcp_dashboard.db"  # <-- full path to your DB
 
-# Read Excel
-df = pd.read_excel(excel_file)
-df = df.fillna("")  # fill empty cells with empty string
+# Open Excel in read-only mode so rows are streamed instead of loaded as a cell tree
+wb = load_workbook(excel_file, read_only=True, data_only=True)
+ws = wb.active
 
 # Connect to SQLite
 conn = sqlite3.connect(sqlite_db)
+# Bulk-load settings, with a larger (~200 MB) page cache for the full load
+tune(conn, cache_size=-200000)
 cursor = conn.cursor()
 
 # Create table if not exists
@@ -29,6 +34,7 @@ CREATE TABLE IF NOT EXISTS jira_kb (
 );
 """
 cursor.execute(create_table_sql)
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_jira_kb_jira_id ON jira_kb(jira_id)")
 
 # Insert rows
 insert_sql = """
@@ -37,19 +43,34 @@ INSERT INTO jira_kb (
 ) VALUES (?, ?, ?, ?, ?, ?, ?);
 """
 
-for _, row in df.iterrows():
-    cursor.execute(insert_sql, (
-        row["Jira_ID"],
-        row["Module"],
-        row["Requirement_Description"],
-        row["Solution_Summary"],
-        row["Key_Objects"],
-        row.get("Code_Snippet", ""),
-        row.get("Notes", "")
-    ))
+# Columns in INSERT order; the optional ones may be missing from the sheet
+columns = ["Jira_ID", "Module", "Requirement_Description", "Solution_Summary",
+           "Key_Objects", "Code_Snippet", "Notes"]
+row_iter = ws.iter_rows(values_only=True)
+header = next(row_iter, ())
+idx = {name: i for i, name in enumerate(header) if name is not None}
+
+
+def cell(row, column):
+    """Value of column in row; empty cells and missing columns become empty strings"""
+    i = idx.get(column)
+    value = row[i] if i is not None and i < len(row) else None
+    return "" if value is None else value
+
+
+def sheet_rows():
+    """Yield one INSERT tuple per non-blank sheet row"""
+    for row in row_iter:
+        if any(value is not None for value in row):
+            yield tuple(cell(row, column) for column in columns)
+
+
+# Bind all rows in one call inside a single transaction
+cursor.executemany(insert_sql, sheet_rows())
 
 # Commit and close
 conn.commit()
 conn.close()
+wb.close()
 
 print(f"✅ All Jira tasks inserted into {sqlite_db} successfully!")
@@ -0,0 +1,53 @@
+"""
+Render the Oracle standards seed data to oracle_standards_seed.sql
+
+The seed is static, so init_oracle_standards_db.py loads it with a single
+executescript instead of binding every row from Python. Re-run this script
+after editing oracle_standards_seed.py.
+"""
+import json
+import os
+
+from oracle_standards_seed import standards_data, templates
+
+SEED_SQL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "oracle_standards_seed.sql")
+
+# created_on is stamped by SQLite when the seed runs, in local ISO-8601 form
+CREATED_ON_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+
+def _quote(value: str) -> str:
+    """SQL string literal"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def render_seed_sql() -> str:
+    """Build the seed script: one transaction of INSERT OR IGNORE statements"""
+    statements = [
+        "-- Generated by build_seed.py from oracle_standards_seed.py; do not edit by hand",
+        "BEGIN IMMEDIATE;",
+    ]
+    for name, description, parameters, usage_example in standards_data:
+        params = _quote(json.dumps(parameters))
+        statements.append(
+            "INSERT OR IGNORE INTO oracle_standards (procedure_name, description, parameters, usage_example, created_on)\n"
+            f"VALUES ({_quote(name)}, {_quote(description)}, {params}, {_quote(usage_example)}, {CREATED_ON_SQL});"
+        )
+        # Rows seeded before parameters became JSON still hold the free-text form
+        statements.append(
+            f"UPDATE oracle_standards SET parameters = {params}\n"
+            f"WHERE procedure_name = {_quote(name)} AND NOT json_valid(parameters);"
+        )
+    for object_type, template_name, template_sql, description in templates:
+        statements.append(
+            "INSERT OR IGNORE INTO sample_templates (object_type, template_name, template_sql, description, created_on)\n"
+            f"VALUES ({_quote(object_type)}, {_quote(template_name)}, {_quote(template_sql)}, {_quote(description)}, {CREATED_ON_SQL});"
+        )
+    statements.append("COMMIT;")
+    return "\n\n".join(statements) + "\n"
+
+
+if __name__ == "__main__":
+    with open(SEED_SQL_FILE, "w", encoding="utf-8", newline="\n") as f:
+        f.write(render_seed_sql())
+    print(f"✅ Seed written to {SEED_SQL_FILE}")
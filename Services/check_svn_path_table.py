@@ -1,25 +1,25 @@
 """
 Script to check the svn_path table structure and data
 """
-import sqlite3
 import os
 
-DB_PATH = r"\\nas3be\ITCrediti\DevMind\mcp_dashboard.db"
+from db import DB_PATH, open_readonly
 
 def check_svn_path_table():
     """Check svn_path table structure and data"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = open_readonly(DB_PATH)
         cursor = conn.cursor()
         
         # Get table schema
         print("=" * 80)
         print("SVN_PATH TABLE SCHEMA")
         print("=" * 80)
-        cursor.execute("PRAGMA table_info(svn_path)")
-        columns = cursor.fetchall()
-        for col in columns:
-            print(f"Column: {col[1]} | Type: {col[2]} | Not Null: {col[3]} | PK: {col[5]}")
+        columns = cursor.execute("PRAGMA table_info(svn_path)").fetchall()
+        col_names = [col[1] for col in columns]
+        print("\n".join(
+            f"Column: {col[1]} | Type: {col[2]} | Not Null: {col[3]} | PK: {col[5]}" for col in columns
+        ))
         
         # Get sample data
         print("\n" + "=" * 80)
@@ -28,14 +28,11 @@ def check_svn_path_table():
         cursor.execute("SELECT * FROM svn_path LIMIT 15")
         rows = cursor.fetchall()
         
-        # Get column names
-        cursor.execute("PRAGMA table_info(svn_path)")
-        col_names = [col[1] for col in cursor.fetchall()]
         print(" | ".join(col_names))
         print("-" * 80)
         
-        for row in rows:
-            print(" | ".join(str(val) for val in row))
+        if rows:
+            print("\n".join(" | ".join(str(val) for val in row) for row in rows))
         
         print("\n" + "=" * 80)
         print(f"Total rows in svn_path: {len(rows)}")
@@ -1,6 +1,6 @@
-import sqlite3
+from db import open_readonly
 
-conn = sqlite3.connect(r'\\nas3be\ITCrediti\DevMind\mcp_dashboard.db')
+conn = open_readonly()
 cursor = conn.cursor()
 
 # Get all tables
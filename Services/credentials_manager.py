@@ -4,10 +4,18 @@ Handles reading credentials from external files
 """
 
 import configparser
+import functools
 import os
 import json
 from typing import Optional, Dict, Any
 
+# tomllib ships with Python 3.11+; older interpreters keep using INI/JSON
+try:
+    import tomllib
+    TOML_AVAILABLE = True
+except ImportError:
+    TOML_AVAILABLE = False
+
 
 class CredentialsManager:
     """Manages secure credential loading from various sources"""
@@ -76,18 +84,24 @@ class CredentialsManager:
     
     def _load_credentials(self):
         """Load credentials from available sources in order of preference"""
-        # 1. Try to load from INI file
+        # 1. Prefer a TOML file next to the resolved path (credentials.toml)
+        toml_file = os.path.splitext(self.credentials_file)[0] + '.toml'
+        if TOML_AVAILABLE and os.path.exists(toml_file):
+            self._load_from_toml(toml_file)
+            return
+        
+        # 2. Try to load from INI file
         if os.path.exists(self.credentials_file):
             self._load_from_ini()
             return
         
-        # 2. Try to load from JSON file
+        # 3. Try to load from JSON file
         json_file = self.credentials_file.replace('.ini', '.json')
         if os.path.exists(json_file):
             self._load_from_json(json_file)
             return
         
-        # 3. Try environment variables
+        # 4. Try environment variables
         self._load_from_env()
     
     def _load_from_ini(self, ini_file: str = None):
@@ -125,6 +139,38 @@ class CredentialsManager:
             print(f"⚠️ Error loading INI file: {e}")
             self._load_from_env()
     
+    def _load_from_toml(self, toml_file: str):
+        """Load credentials from TOML file ([jira] and [jira_settings] tables, as in the INI)"""
+        try:
+            with open(toml_file, 'rb') as f:
+                config = tomllib.load(f)
+            
+            jira = config.get('jira', {})
+            self.credentials.update({
+                'username': jira.get('username'),
+                'password': jira.get('password'),
+                'api_token': jira.get('api_token')
+            })
+            
+            if 'jira_settings' in config:
+                settings = config['jira_settings']
+                verify_ssl = settings.get('verify_ssl', False)
+                if not isinstance(verify_ssl, bool):
+                    raise ValueError(f"verify_ssl must be true or false, got {verify_ssl!r}")
+                self.credentials.update({
+                    'base_url': settings.get('base_url', 'https://svil.bansel.it/jira'),
+                    'verify_ssl': verify_ssl,
+                    'default_issue': settings.get('default_issue', 'PH-198'),
+                    'default_project': settings.get('default_project', 'PH'),
+                    'download_path': settings.get('download_path')
+                })
+            
+            print(f"✅ Loaded credentials from {toml_file}")
+            
+        except Exception as e:
+            print(f"⚠️ Error loading TOML file: {e}")
+            self._load_from_env()
+    
     def _load_from_json(self, json_file: str):
         """Load credentials from JSON file"""
         try:
@@ -275,6 +321,17 @@ download_path = C:\\Users\\GBS05273\\Downloads
         print(f"Has Valid Credentials: {'✅ Yes' if self.has_credentials() else '❌ No'}")
 
 
+@functools.lru_cache(maxsize=None)
+def get_credentials(credentials_file: str = None) -> CredentialsManager:
+    """
+    Shared CredentialsManager, parsed once per credentials_file
+    
+    Call get_credentials.cache_clear() after editing the credentials file
+    to have the next call read it again.
+    """
+    return CredentialsManager(credentials_file)
+
+
 def create_sample_credentials():
     """Create sample credential files for demonstration"""
     
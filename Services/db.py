@@ -0,0 +1,118 @@
+"""
+Shared SQLite connection for the DevMind dashboard database
+
+Opening the database over the UNC share costs an SMB handshake and a file lock
+on every connect, so the MCP server and the check scripts reuse one connection
+per database file. Code that may use the connection from several threads
+holds get_lock(db_path) for the duration of its work. Connections are opened
+with the database's own journal mode; only the dashboard, which every DevMind
+client already runs in WAL, asks for wal=True. Nothing is memory-mapped, since
+the files live on a network share. Diagnostic scripts use open_readonly(),
+which also refuses writes.
+
+Scripts that rewrite a database in bulk call tune() on their own connection.
+
+Large dashboard files (generated code, test cases) are kept out of the
+database: save_artifact() writes them under ARTIFACTS_DIR, one file per Jira
+and kind of file, and the tables store the returned path.
+"""
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+DB_DIR = r"\\nas3be\ITCrediti\DevMind"
+DB_PATH = os.path.join(DB_DIR, "mcp_dashboard.db")
+# Generated code and test case files live next to the database, referenced by path
+ARTIFACTS_DIR = os.path.join(DB_DIR, "artifacts")
+
+_connections: Dict[str, sqlite3.Connection] = {}
+_locks: Dict[str, threading.RLock] = {}
+_guard = threading.Lock()
+
+
+def get_conn(db_path: str = DB_PATH, wal: bool = False) -> sqlite3.Connection:
+    """Return the shared connection for db_path, opening it on first use
+
+    wal=True switches the file to WAL with synchronous=NORMAL when it is opened;
+    otherwise the journal settings stored in the file are left alone.
+    """
+    conn = _connections.get(db_path)
+    if conn is not None:
+        return conn
+    with _guard:
+        conn = _connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False, cached_statements=128)
+            if wal:
+                conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                """)
+            _connections[db_path] = conn
+    return conn
+
+
+def open_readonly(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """Open a private connection that leaves the database settings alone and refuses writes"""
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+def tune(conn: sqlite3.Connection, cache_size: int = -65536, journal_mode: str = "WAL") -> None:
+    """WAL journal, no per-commit fsync, in-memory temp tables, wait on locks
+
+    cache_size follows PRAGMA cache_size: negative values are KiB (-65536 is 64 MiB).
+    Pass journal_mode="DELETE" for a file that will be copied to the share with
+    the backup API, which carries the journal mode over in the database header.
+    """
+    conn.executescript(f"""
+    PRAGMA journal_mode={journal_mode};
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size={int(cache_size)};
+    PRAGMA busy_timeout=5000;
+    """)
+
+
+def get_lock(db_path: str = DB_PATH) -> threading.RLock:
+    """Return the lock guarding the shared connection for db_path"""
+    lock = _locks.get(db_path)
+    if lock is None:
+        with _guard:
+            lock = _locks.setdefault(db_path, threading.RLock())
+    return lock
+
+
+def close_all() -> None:
+    """Close every shared connection (used on shutdown)"""
+    with _guard:
+        for conn in _connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _connections.clear()
+        _locks.clear()
+
+
+def save_artifact(jira_number: str, kind: str, content: Optional[bytes], extension: str = ".sql",
+                  artifacts_dir: str = ARTIFACTS_DIR) -> Optional[str]:
+    """Write a dashboard file to artifacts_dir/<jira_number>/<kind><extension> and return its path
+
+    kind names the column the file belongs to ("generated_code", "test_case").
+    The path is fixed per Jira and kind, so saving again replaces the previous
+    file instead of orphaning it.
+    """
+    if content is None:
+        return None
+    target_dir = os.path.join(artifacts_dir, jira_number)
+    os.makedirs(target_dir, exist_ok=True)
+    path = os.path.join(target_dir, f"{kind}{extension}")
+    # Write aside and swap in, so a reader never sees a half-written file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return path
@@ -2,6 +2,8 @@ import os
 import sqlite3
 from datetime import datetime
 
+from db import save_artifact, tune
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
@@ -17,6 +19,8 @@ os.makedirs(DB_DIR, exist_ok=True)
 # ============================================================
 
 conn = sqlite3.connect(DB_FILE)
+# Bulk-load settings, with a larger (~200 MB) page cache for the full reload
+tune(conn, cache_size=-200000)
 cursor = conn.cursor()
 print(f"✅ Connected to SQLite DB: {DB_FILE}")
 
@@ -26,6 +30,8 @@ print(f"✅ Connected to SQLite DB: {DB_FILE}")
 
 cursor.executescript("""
 DROP TABLE IF EXISTS jira_dashboard;
+-- A fresh table invalidates the To-Do sync mark; the next sync fetches everything
+DROP TABLE IF EXISTS jira_todo_sync_state;
 
 CREATE TABLE jira_dashboard (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -38,8 +44,8 @@ CREATE TABLE jira_dashboard (
     requirement_clarity TEXT,
     automation TEXT,
     analysis_code_gen_prompt TEXT,
-    generated_code_file BLOB,         -- stores actual file binary data
-    test_case_file BLOB,              -- stores actual test case file binary data
+    generated_code_path TEXT,         -- path of the generated code file under artifacts/
+    test_case_path TEXT,              -- path of the test case file under artifacts/
     decision TEXT DEFAULT 'PENDING',  -- APPROVED / REJECTED / PENDING
     deployment_prompt TEXT,
     last_updated TEXT
@@ -52,7 +58,7 @@ print("✅ Table 'jira_dashboard' created successfully.")
 # SAMPLE DATA INSERTION
 # ============================================================
 
-# Sample file content as binary data
+# Sample file content, written to the artifacts share and referenced by path
 sample_sql_code = "CREATE TABLE CUSTOMER (ID NUMBER, NAME VARCHAR2(50));"
 sample_test_code = """-- Test cases for CUSTOMER table
 INSERT INTO CUSTOMER VALUES (1, 'John Doe');
@@ -67,28 +73,33 @@ INSERT INTO ACCOUNTS VALUES (1002, 2500.50);
 SELECT * FROM ACCOUNTS WHERE BALANCE > 1000;
 UPDATE ACCOUNTS SET BALANCE = 3000.00 WHERE ACC_ID = 1001;"""
 
+# One timestamp for the whole seed
+now = datetime.now()
+today = now.strftime("%Y-%m-%d")
+now_iso = now.isoformat()
+
 sample_data = [
     (
         "JIRA-101",
         "Customer Database Creation", 
         "John Doe",
-        datetime.now().strftime("%Y-%m-%d"),
+        today,
         "High",
         "Story",
         "Clear",
         "Yes",
         "Create a customer table with ID and NAME columns for the new CRM system",
-        sample_sql_code.encode('utf-8'),      # generated code file content as binary
-        sample_test_code.encode('utf-8'),     # test case file content as binary
+        save_artifact("JIRA-101", "generated_code", sample_sql_code.encode('utf-8')),
+        save_artifact("JIRA-101", "test_case", sample_test_code.encode('utf-8')),
         "PENDING",
         "Deploy to development environment first",
-        datetime.now().isoformat()
+        now_iso
     ),
     (
         "JIRA-102",
         "Account Management System",
         "Jane Smith", 
-        datetime.now().strftime("%Y-%m-%d"),
+        today,
         "Medium",
         "Bug",
         "Unclear",
@@ -98,29 +109,31 @@ sample_data = [
         None,  # no test case file yet
         "PENDING",
         "",
-        datetime.now().isoformat()
+        now_iso
     ),
     (
         "JIRA-103",
         "Financial Reporting Module",
         "Alex Lee",
-        datetime.now().strftime("%Y-%m-%d"),
+        today,
         "Low", 
         "Enhancement",
         "Clear",
         "Yes",
         "Create accounts table for financial reporting with balance tracking",
-        sample_accounts_code.encode('utf-8'),     # generated code file content as binary
-        sample_accounts_test.encode('utf-8'),     # test case file content as binary
+        save_artifact("JIRA-103", "generated_code", sample_accounts_code.encode('utf-8')),
+        save_artifact("JIRA-103", "test_case", sample_accounts_test.encode('utf-8')),
         "APPROVED",
         "Ready for production deployment",
-        datetime.now().isoformat()
+        now_iso
     )
 ]
 
+# Take the write lock once and insert every sample row in a single transaction
+conn.execute("BEGIN IMMEDIATE")
 cursor.executemany("""
 INSERT INTO jira_dashboard 
-(jira_number, jira_heading, assignee, created, priority, type, requirement_clarity, automation, analysis_code_gen_prompt, generated_code_file, test_case_file, decision, deployment_prompt, last_updated)
+(jira_number, jira_heading, assignee, created, priority, type, requirement_clarity, automation, analysis_code_gen_prompt, generated_code_path, test_case_path, decision, deployment_prompt, last_updated)
 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 """, sample_data)
 
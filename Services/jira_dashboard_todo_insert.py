@@ -11,18 +11,16 @@ Table: jira_dashboard
 import os
 import sys
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import requests
-from requests.auth import HTTPBasicAuth
-import urllib3
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from credentials_manager import CredentialsManager
+from db import tune
 
-# Disable SSL warnings for self-signed certificates
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# requests/urllib3 and credentials_manager are imported where they are first
+# needed (JiraClient, main) to keep interpreter startup cheap
 
 # ============================================================
 # CONFIGURATION
@@ -32,6 +30,42 @@ DB_DIR = r"\\nas3be\ITCrediti\DevMind"
 DB_FILE = os.path.join(DB_DIR, "mcp_dashboard.db")
 ASSIGNEE_NAME = "B Balakrishnan"
 STATUS_FILTER = "To Do"
+SEARCH_PAGE_SIZE = 100    # Issues per /search request
+SEARCH_MAX_WORKERS = 8    # Concurrent page requests after the first page
+
+# jira_number has a unique index, so OR IGNORE skips issues already on the dashboard
+INSERT_ISSUE_SQL = """
+    INSERT OR IGNORE INTO jira_dashboard (
+        jira_number, jira_heading, assignee, created,
+        priority, type, status, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Keys per IN (...) lookup; stays under SQLite's default 999 bound parameters
+EXISTING_KEYS_CHUNK = 500
+
+# Start time of the last successful sync. Kept apart from jira_dashboard.last_updated,
+# which the MCP server and the init script also stamp on unrelated edits
+SYNC_STATE_DDL = """
+    CREATE TABLE IF NOT EXISTS jira_todo_sync_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        last_sync TEXT NOT NULL
+    )
+"""
+LAST_SYNC_SQL = "SELECT last_sync FROM jira_todo_sync_state WHERE id = 1"
+RECORD_SYNC_SQL = "INSERT OR REPLACE INTO jira_todo_sync_state (id, last_sync) VALUES (1, ?)"
+
+# Shared read-only default for missing nested Jira objects
+_EMPTY = {}
+
+# Checked on the table itself: init_mcp_dashboard_db.py recreates jira_dashboard
+# without either, so a database-wide marker such as user_version can lie
+SCHEMA_PROBE_SQL = """
+    SELECT
+        EXISTS(SELECT 1 FROM pragma_table_info('jira_dashboard') WHERE name = 'status'),
+        EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_jira_number_unique')
+"""
+# Set once ensure_status_column has verified the schema in this process
+_schema_checked = False
 
 # ============================================================
 # JIRA API CLIENT
@@ -42,6 +76,15 @@ class JiraClient:
     
     def __init__(self, credentials_manager):
         """Initialize Jira client with credentials"""
+        import requests
+        import urllib3
+        from requests.adapters import HTTPAdapter
+        from requests.auth import HTTPBasicAuth
+        from urllib3.util.retry import Retry
+        
+        # Disable SSL warnings for self-signed certificates
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        
         self.creds = credentials_manager
         self.base_url = self.creds.get_base_url().rstrip('/')
         self.api_base = f"{self.base_url}/rest/api/2"
@@ -58,41 +101,69 @@ class JiraClient:
             self.auth = HTTPBasicAuth(username, password)
         else:
             raise ValueError("No valid credentials found")
+        
+        # One session so every page request reuses a pooled TCP/TLS connection
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.verify = self.verify_ssl
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(10, SEARCH_MAX_WORKERS),
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def search_issues(self, jql, max_results=50):
+    def _search_page(self, jql, start_at, page_size):
+        """Fetch one page of search results; returns the response JSON or None if error"""
+        params = {
+            'jql': jql,
+            'startAt': start_at,
+            'maxResults': page_size,
+            'fields': 'summary,assignee,created,priority,issuetype,status'
+        }
+        
+        response = self.session.get(f"{self.api_base}/search", params=params, timeout=30)
+        
+        if response.status_code == 200:
+            return response.json()
+        print(f"❌ Error searching issues: {response.status_code}")
+        print(f"Response: {response.text}")
+        return None
+    
+    def search_issues(self, jql, page_size=SEARCH_PAGE_SIZE):
         """
-        Search for issues using JQL
+        Search for issues using JQL, following pagination until all results are fetched
+        
+        The first page reports the total; the remaining pages are requested
+        concurrently.
         
         Args:
             jql: JQL query string
-            max_results: Maximum number of results to return
+            page_size: Number of issues requested per page
             
         Returns:
             List of issues or None if error
         """
         try:
-            url = f"{self.api_base}/search"
-            params = {
-                'jql': jql,
-                'maxResults': max_results,
-                'fields': 'summary,assignee,created,priority,issuetype,status'
-            }
+            first = self._search_page(jql, 0, page_size)
+            if first is None:
+                return None
+            
+            issues = first.get('issues', [])
+            total = first.get('total', len(issues))
+            offsets = range(page_size, total, page_size)
+            if not offsets:
+                return issues
             
-            response = requests.get(
-                url,
-                auth=self.auth,
-                params=params,
-                verify=self.verify_ssl,
-                timeout=30
-            )
+            with ThreadPoolExecutor(max_workers=SEARCH_MAX_WORKERS) as pool:
+                pages = list(pool.map(lambda start_at: self._search_page(jql, start_at, page_size), offsets))
             
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('issues', [])
-            else:
-                print(f"❌ Error searching issues: {response.status_code}")
-                print(f"Response: {response.text}")
+            if any(page is None for page in pages):
                 return None
+            for page in pages:
+                issues.extend(page.get('issues', []))
+            return issues
                 
         except Exception as e:
             print(f"❌ Exception searching issues: {str(e)}")
@@ -107,27 +178,25 @@ def ensure_status_column(cursor):
     Ensure the status column exists in jira_dashboard table.
     If it doesn't exist, add it.
     Also ensures jira_number has a unique index to prevent duplicates.
+    A single probe query returns both flags, so an up-to-date schema costs
+    one round-trip.
     """
+    global _schema_checked
+    if _schema_checked:
+        return
     try:
-        # Check if status column exists
-        cursor.execute("PRAGMA table_info(jira_dashboard)")
-        columns = [row[1] for row in cursor.fetchall()]
+        # Status column and unique index in one round-trip
+        # (PRAGMA table-valued functions need SQLite 3.16+)
+        has_status, has_index = cursor.execute(SCHEMA_PROBE_SQL).fetchone()
         
-        if 'status' not in columns:
+        if not has_status:
             print("⚠️ Status column not found, adding it...")
             cursor.execute("ALTER TABLE jira_dashboard ADD COLUMN status TEXT")
             print("✅ Status column added successfully")
         else:
             print("✅ Status column already exists")
         
-        # Check if unique index exists on jira_number
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='index' AND name='idx_jira_number_unique'
-        """)
-        index_exists = cursor.fetchone()
-        
-        if not index_exists:
+        if not has_index:
             print("⚠️ Unique index not found on jira_number, creating it...")
             cursor.execute("""
                 CREATE UNIQUE INDEX IF NOT EXISTS idx_jira_number_unique 
@@ -136,107 +205,45 @@ def ensure_status_column(cursor):
             print("✅ Unique index created successfully (prevents duplicate jira_numbers)")
         else:
             print("✅ Unique index on jira_number already exists")
+        
+        _schema_checked = True
             
     except Exception as e:
         print(f"❌ Error ensuring database schema: {str(e)}")
         raise
 
-def insert_or_update_jira_issue(cursor, issue_data):
+def parse_jira_issue(issue, now_iso):
     """
-    Insert a Jira issue in the database ONLY if it doesn't already exist.
-    If the jira_number already exists, skip it (no update, no duplicate).
-    
-    Args:
-        cursor: Database cursor
-        issue_data: Dictionary containing issue data
-        
-    Returns:
-        'inserted' if new record inserted, 'skipped' if already exists, 'error' if failed
-    """
-    try:
-        # Check if issue already exists
-        cursor.execute(
-            "SELECT id FROM jira_dashboard WHERE jira_number = ?",
-            (issue_data['jira_number'],)
-        )
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Issue already exists - skip it
-            print(f"  ⏭️  Skipped (already exists): {issue_data['jira_number']}")
-            return 'skipped'
-        else:
-            # Insert new record only
-            cursor.execute("""
-                INSERT INTO jira_dashboard (
-                    jira_number, jira_heading, assignee, created,
-                    priority, type, status, last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                issue_data['jira_number'],
-                issue_data['jira_heading'],
-                issue_data['assignee'],
-                issue_data['created'],
-                issue_data['priority'],
-                issue_data['type'],
-                issue_data['status'],
-                issue_data['last_updated']
-            ))
-            print(f"  ✅ Inserted: {issue_data['jira_number']}")
-            return 'inserted'
-        
-    except Exception as e:
-        print(f"  ❌ Error processing {issue_data.get('jira_number', 'Unknown')}: {str(e)}")
-        return 'error'
-
-def parse_jira_issue(issue):
-    """
-    Parse Jira issue JSON into a dictionary for database insertion
+    Parse Jira issue JSON into a row for INSERT_ISSUE_SQL
     
     Args:
         issue: Jira issue JSON object
+        now_iso: ISO timestamp stored as last_updated (shared by the whole batch)
         
     Returns:
-        Dictionary with parsed issue data
+        Tuple in INSERT_ISSUE_SQL column order
     """
-    fields = issue.get('fields', {})
-    
-    # Extract assignee
-    assignee_obj = fields.get('assignee', {})
-    assignee = assignee_obj.get('displayName', 'Unassigned') if assignee_obj else 'Unassigned'
-    
-    # Extract priority
-    priority_obj = fields.get('priority', {})
-    priority = priority_obj.get('name', 'Unknown') if priority_obj else 'Unknown'
+    fields = issue.get('fields') or _EMPTY
     
-    # Extract issue type
-    issuetype_obj = fields.get('issuetype', {})
-    issue_type = issuetype_obj.get('name', 'Unknown') if issuetype_obj else 'Unknown'
+    # Nested objects may be missing or null; fall back to an empty dict
+    assignee = (fields.get('assignee') or _EMPTY).get('displayName', 'Unassigned')
+    priority = (fields.get('priority') or _EMPTY).get('name', 'Unknown')
+    issue_type = (fields.get('issuetype') or _EMPTY).get('name', 'Unknown')
+    status = (fields.get('status') or _EMPTY).get('name', 'Unknown')
     
-    # Extract status
-    status_obj = fields.get('status', {})
-    status = status_obj.get('name', 'Unknown') if status_obj else 'Unknown'
-    
-    # Extract created date
-    created = fields.get('created', '')
-    if created:
-        # Convert ISO format to simple date format
-        try:
-            created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-            created = created_dt.strftime('%Y-%m-%d')
-        except:
-            created = created.split('T')[0] if 'T' in created else created
+    # Extract created date: Jira sends ISO-8601 ("2024-01-15T10:30:00.000+0100"), keep the date part
+    created = (fields.get('created') or '')[:10]
     
-    return {
-        'jira_number': issue.get('key', 'Unknown'),
-        'jira_heading': fields.get('summary', 'No Summary'),
-        'assignee': assignee,
-        'created': created,
-        'priority': priority,
-        'type': issue_type,
-        'status': status,
-        'last_updated': datetime.now().isoformat()
-    }
+    return (
+        issue.get('key', 'Unknown'),            # jira_number
+        fields.get('summary', 'No Summary'),    # jira_heading
+        assignee,
+        created,
+        priority,
+        issue_type,                             # type
+        status,
+        now_iso                                 # last_updated
+    )
 
 # ============================================================
 # MAIN EXECUTION
@@ -256,7 +263,8 @@ def main():
     # Initialize credentials manager
     try:
         print("📝 Loading Jira credentials...")
-        creds = CredentialsManager("credentials.ini")
+        from credentials_manager import get_credentials
+        creds = get_credentials("credentials.ini")
         print(f"✅ Credentials loaded successfully")
         print(f"   Base URL: {creds.get_base_url()}")
         print(f"   Username: {creds.get_username()}")
@@ -275,21 +283,60 @@ def main():
         print(f"❌ Error initializing Jira client: {str(e)}")
         return 1
     
-    # Search for issues
+    # Connect to database
+    try:
+        print("💾 Connecting to database...")
+        conn = sqlite3.connect(DB_FILE)
+        tune(conn)
+        cursor = conn.cursor()
+        print(f"✅ Connected to database: {DB_FILE}")
+        print()
+    except Exception as e:
+        print(f"❌ Error connecting to database: {str(e)}")
+        return 1
+    
+    # Ensure status column exists
+    try:
+        ensure_status_column(cursor)
+        conn.commit()
+        print()
+    except Exception as e:
+        print(f"❌ Error ensuring database schema: {str(e)}")
+        conn.close()
+        return 1
+    
+    # Search for issues changed since the last sync
     try:
         print(f"🔍 Searching for issues...")
+        # Taken before the search so issues updated while this run is in flight
+        # are fetched again next time
+        sync_started = datetime.now().isoformat()
+        cursor.execute(SYNC_STATE_DDL)
+        row = cursor.execute(LAST_SYNC_SQL).fetchone()
         jql = f'assignee = "{ASSIGNEE_NAME}" AND status = "{STATUS_FILTER}"'
+        if row:
+            # Issues not updated since the last successful sync were already
+            # offered to the dashboard then, so only the delta is fetched
+            last_sync = row[0][:10]
+            jql += f' AND updated >= "{last_sync}"'
+        else:
+            last_sync = None  # First sync: fetch the full To-Do list
         print(f"   JQL: {jql}")
         print()
         
-        issues = jira.search_issues(jql, max_results=50)
+        issues = jira.search_issues(jql)
         
         if issues is None:
             print("❌ Failed to fetch issues from Jira")
+            conn.close()
             return 1
         
         if not issues:
-            print(f"ℹ️ No issues found for assignee '{ASSIGNEE_NAME}' with status '{STATUS_FILTER}'")
+            since = f" updated since {last_sync}" if last_sync else ""
+            print(f"ℹ️ No issues{since} for assignee '{ASSIGNEE_NAME}' with status '{STATUS_FILTER}'")
+            cursor.execute(RECORD_SYNC_SQL, (sync_started,))
+            conn.commit()
+            conn.close()
             return 0
         
         print(f"✅ Found {len(issues)} issue(s)")
@@ -297,26 +344,6 @@ def main():
         
     except Exception as e:
         print(f"❌ Error searching for issues: {str(e)}")
-        return 1
-    
-    # Connect to database
-    try:
-        print("💾 Connecting to database...")
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        print(f"✅ Connected to database: {DB_FILE}")
-        print()
-    except Exception as e:
-        print(f"❌ Error connecting to database: {str(e)}")
-        return 1
-    
-    # Ensure status column exists
-    try:
-        ensure_status_column(cursor)
-        conn.commit()
-        print()
-    except Exception as e:
-        print(f"❌ Error ensuring database schema: {str(e)}")
         conn.close()
         return 1
     
@@ -325,23 +352,34 @@ def main():
         print(f"📥 Processing {len(issues)} issue(s)...")
         print()
         
-        inserted_count = 0
-        skipped_count = 0
-        error_count = 0
+        now_iso = datetime.now().isoformat()
         
-        for issue in issues:
-            issue_data = parse_jira_issue(issue)
-            result = insert_or_update_jira_issue(cursor, issue_data)
-            
-            if result == 'inserted':
-                inserted_count += 1
-            elif result == 'skipped':
-                skipped_count += 1
-            elif result == 'error':
-                error_count += 1
-        
-        # Commit changes
+        # One transaction and one prepared statement for the whole batch;
+        # rows are parsed lazily as executemany consumes them
+        changes_before = conn.total_changes
+        cursor.execute("BEGIN")
+        # Keys already on the dashboard, looked up through the unique jira_number index
+        batch_keys = [issue.get('key', 'Unknown') for issue in issues]
+        existing_keys = set()
+        for start in range(0, len(batch_keys), EXISTING_KEYS_CHUNK):
+            chunk = batch_keys[start:start + EXISTING_KEYS_CHUNK]
+            existing_keys.update(row[0] for row in cursor.execute(
+                f"SELECT jira_number FROM jira_dashboard WHERE jira_number IN ({','.join('?' * len(chunk))})",
+                chunk
+            ))
+        cursor.executemany(INSERT_ISSUE_SQL, (parse_jira_issue(issue, now_iso) for issue in issues))
+        inserted_count = conn.total_changes - changes_before
+        skipped_count = len(issues) - inserted_count
+        inserted_keys = set(batch_keys) - existing_keys
+        skipped_keys = [key for key in batch_keys if key in existing_keys]
         conn.commit()
+        # Only a committed batch moves the sync mark forward
+        cursor.execute(RECORD_SYNC_SQL, (sync_started,))
+        conn.commit()
+        
+        # Per-issue results go out as two lines instead of one print per issue
+        print(f"  ✅ Inserted: {', '.join(sorted(inserted_keys)) or '-'}")
+        print(f"  ⏭️  Skipped (already exists): {', '.join(skipped_keys) or '-'}")
         print()
         print("=" * 70)
         print("📊 PROCESSING SUMMARY:")
@@ -349,7 +387,6 @@ def main():
         print(f"  Total Issues Found:     {len(issues)}")
         print(f"  ✅ Newly Inserted:      {inserted_count}")
         print(f"  ⏭️  Skipped (Existing): {skipped_count}")
-        print(f"  ❌ Errors:              {error_count}")
         print("=" * 70)
         
     except Exception as e:
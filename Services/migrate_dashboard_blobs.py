@@ -0,0 +1,85 @@
+"""
+One-off migration: move jira_dashboard file BLOBs out of the database
+
+Older databases keep generated_code_file / test_case_file as BLOB columns.
+This script writes each stored file to the artifacts share, records its path
+in generated_code_path / test_case_path and drops the BLOB columns, so
+dashboard queries no longer page file contents over SMB.
+
+The monitoring service picks its has_code/has_test columns when it connects,
+so restart it after running this script.
+"""
+import os
+import sqlite3
+
+from db import DB_PATH, save_artifact
+
+# old BLOB column -> new path column
+COLUMN_MAP = {
+    "generated_code_file": "generated_code_path",
+    "test_case_file": "test_case_path",
+}
+# old BLOB column -> artifact kind (file name); the BLOBs hold SQL scripts
+ARTIFACT_KIND = {
+    "generated_code_file": "generated_code",
+    "test_case_file": "test_case",
+}
+
+
+def migrate_dashboard_blobs():
+    """Dump BLOBs to files, store their paths and drop the BLOB columns"""
+    conn = sqlite3.connect(DB_PATH, timeout=30.0)
+    try:
+        cursor = conn.cursor()
+        existing = {col[1] for col in cursor.execute("PRAGMA table_info(jira_dashboard)").fetchall()}
+        blob_columns = [old for old in COLUMN_MAP if old in existing]
+        if not blob_columns:
+            print("ℹ️ jira_dashboard has no BLOB columns left, nothing to migrate")
+            return
+
+        for old in blob_columns:
+            if COLUMN_MAP[old] not in existing:
+                cursor.execute(f"ALTER TABLE jira_dashboard ADD COLUMN {COLUMN_MAP[old]} TEXT")
+
+        select_columns = ", ".join(blob_columns)
+        rows = cursor.execute(
+            f"SELECT id, jira_number, {select_columns} FROM jira_dashboard"
+        ).fetchall()
+
+        updates = []
+        for row_id, jira_number, *blobs in rows:
+            paths = [save_artifact(jira_number, ARTIFACT_KIND[old], blob)
+                     for old, blob in zip(blob_columns, blobs)]
+            updates.append((*paths, row_id))
+
+        assignments = ", ".join(f"{COLUMN_MAP[old]} = ?" for old in blob_columns)
+        cursor.executemany(f"UPDATE jira_dashboard SET {assignments} WHERE id = ?", updates)
+        conn.commit()
+        print(f"✅ Moved files for {len(updates)} rows to the artifacts share")
+
+        # DROP COLUMN needs SQLite 3.35+; older versions keep the emptied columns
+        try:
+            for old in blob_columns:
+                cursor.execute(f"ALTER TABLE jira_dashboard DROP COLUMN {old}")
+            conn.commit()
+            print(f"✅ Dropped columns: {select_columns}")
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            cursor.execute(f"UPDATE jira_dashboard SET {', '.join(f'{old} = NULL' for old in blob_columns)}")
+            conn.commit()
+            print(f"⚠️ Could not drop BLOB columns ({e}); cleared them instead")
+
+        conn.execute("VACUUM")
+        print("\n🎉 Migration completed successfully!")
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Error: {str(e)}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    if not os.path.exists(DB_PATH):
+        print(f"❌ Database not found at {DB_PATH}")
+    else:
+        migrate_dashboard_blobs()
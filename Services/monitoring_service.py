@@ -2,24 +2,136 @@
 Real-time monitoring service for Jira automation workflow
 Provides WebSocket updates on task progress and database changes
 """
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+from collections import OrderedDict, namedtuple
+from contextlib import asynccontextmanager
 import sqlite3
 import asyncio
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Optional faster JSON serialization for broadcasts
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Database path
 DB_PATH = r"\\nas3be\ITCrediti\DevMind\mcp_dashboard.db"
 
-app = FastAPI(title="DevMind Monitoring Service")
+# Change detection: a cheap data_version check every second, the watermark
+# query only when it moves (or at least once per fallback interval)
+CHANGE_CHECK_INTERVAL = 1.0
+CHANGE_FALLBACK_INTERVAL = 60.0
+
+# Outgoing messages buffered per WebSocket; the oldest is dropped when a client falls behind
+SEND_QUEUE_SIZE = 32
+# Jira numbers whose latest progress update is kept for late subscribers
+PROGRESS_CACHE_SIZE = 256
+# Progress bursts for one Jira are coalesced into the latest update per window
+PROGRESS_DEBOUNCE = 0.05
+PROGRESS_TERMINAL_STATES = {"completed", "error"}
+
+# Dashboard queries, compiled once per connection via the sqlite3 statement cache
+SQL_TASK_COLUMNS = """
+    SELECT 
+        jira_number, jira_heading, status, assignee, priority,
+        requirement_clarity, automation, created, last_updated, decision,
+        {has_code} as has_code,
+        {has_test} as has_test,
+        comment
+    FROM jira_dashboard 
+"""
+# Column behind each file flag, newest layout first: databases not yet run through
+# migrate_dashboard_blobs.py still carry the BLOB columns instead of the paths
+FILE_FLAG_COLUMNS = {
+    "has_code": ("generated_code_path", "generated_code_file"),
+    "has_test": ("test_case_path", "test_case_file"),
+}
+SQL_DASHBOARD_COLUMNS = "SELECT name FROM pragma_table_info('jira_dashboard')"
+# Column order of the task and prompt queries; rows come back as plain tuples
+# and are zipped with these fields only when building the JSON response
+TaskRow = namedtuple("TaskRow", "jira_number jira_heading status assignee priority "
+                     "requirement_clarity automation created last_updated decision "
+                     "has_code has_test comment")
+PromptRow = namedtuple("PromptRow", "p_id jira_number category has_analysis has_code "
+                       "has_test has_deployment rewards created_at")
+# Task queries by name, completed by _build_task_queries for the connected database
+TASK_QUERY_CLAUSES = {
+    "status": "WHERE jira_number = ?",
+    "all": "ORDER BY last_updated DESC",
+    "changed": "WHERE last_updated >= ? ORDER BY last_updated",
+}
+# Bumped by SQLite whenever another connection commits to the database
+SQL_DATA_VERSION = "PRAGMA data_version"
+SQL_LAST_UPDATED_INDEX = "CREATE INDEX IF NOT EXISTS idx_last_updated ON jira_dashboard(last_updated)"
+SQL_PROMPTS = """
+    SELECT 
+        p_id, jira_number, category, 
+        CASE WHEN analysis_prompt IS NOT NULL THEN 1 ELSE 0 END as has_analysis,
+        CASE WHEN gen_code IS NOT NULL THEN 1 ELSE 0 END as has_code,
+        CASE WHEN gen_test_case IS NOT NULL THEN 1 ELSE 0 END as has_test,
+        CASE WHEN deployment_prompt IS NOT NULL THEN 1 ELSE 0 END as has_deployment,
+        rewards, created_at
+    FROM jira_prompts 
+    WHERE jira_number = ?
+    ORDER BY p_id DESC
+    LIMIT 1
+"""
+
+def _start_log_listener() -> QueueListener:
+    """Move the root handlers behind a queue so log writes happen off the event loop"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+def _stop_log_listener(listener: QueueListener):
+    """Flush queued records and give the root logger its handlers back"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared database connection and run the change monitor for the app's lifetime"""
+    log_listener = _start_log_listener()
+    # A small dedicated pool for the blocking SQLite calls, so slow UNC reads
+    # cannot tie up the default executor's threads
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=4, thread_name_prefix="monitoring-db")
+    )
+    app.state.db = await asyncio.to_thread(get_db_connection)
+    try:
+        await asyncio.to_thread(_ensure_indexes_sync)
+    except Exception as e:
+        logger.error("Could not create last_updated index: %s", e)
+    
+    # Database polling task (fallback if MCP tools don't send notifications)
+    monitor = asyncio.create_task(poll_database_changes())
+    try:
+        yield
+    finally:
+        monitor.cancel()
+        close_db_connection()
+        app.state.db = None
+        _stop_log_listener(log_listener)
+
+app = FastAPI(title="DevMind Monitoring Service", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -60,18 +172,85 @@ class TaskStatus(BaseModel):
     has_code: bool
     has_test: bool
 
+def _encode(message: dict) -> str:
+    """Serialize a broadcast once, in the same compact form Starlette's send_json uses"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(message).decode('utf-8')
+        except TypeError:
+            pass  # e.g. non-string dict keys; the stdlib encoder handles those
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
         # Track progress-specific connections by Jira number
         self.progress_connections: Dict[str, set] = {}
-        self.progress_cache: Dict[str, ProgressUpdate] = {}
+        # Latest sent update per Jira, already JSON-encoded, least recently updated first (bounded)
+        self.progress_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Second (YYYY-MM-DDTHH:MM:SS) of the newest last_updated broadcast by the
+        # database poll, and the (jira_number, last_updated) pairs sent within it
+        self._watermark: str = ""
+        self._sent_at_watermark: set = set()
+        # Per-socket outgoing queue and the task draining it
+        self._send_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        # Latest not-yet-sent progress update per Jira and the task that will flush it
+        self._pending: Dict[str, ProgressUpdate] = {}
+        self._flush_task: Dict[str, asyncio.Task] = {}
+        # Set while at least one dashboard is connected; the database poll waits on it
+        self._has_clients = asyncio.Event()
+
+    def _attach(self, websocket: WebSocket):
+        """Start the sender task for a newly accepted socket"""
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._send_queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, queue))
+
+    def _detach(self, websocket: WebSocket):
+        """Stop the sender task of a socket that went away"""
+        self._send_queues.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender and sender is not asyncio.current_task():
+            sender.cancel()
+
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Write queued payloads to one socket; a slow client only backs up its own queue"""
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Error sending to client: %s", e)
+            # Clean up disconnected client
+            if websocket in self.active_connections:
+                self.active_connections.remove(websocket)
+                if not self.active_connections:
+                    self._has_clients.clear()
+            for jira_number in list(self.progress_connections):
+                self.disconnect_progress(websocket, jira_number)
+            self._detach(websocket)
+
+    def _enqueue(self, websocket: WebSocket, payload: str):
+        """Queue a payload for a socket, dropping its oldest pending message when full"""
+        queue = self._send_queues.get(websocket)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(payload)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         self.active_connections.append(websocket)
-        logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
+        self._has_clients.set()
+        self._attach(websocket)
+        logger.info("Client connected. Total connections: %d", len(self.active_connections))
 
     async def connect_progress(self, websocket: WebSocket, jira_number: str):
         """Connect to progress monitoring for specific Jira"""
@@ -79,16 +258,20 @@ class ConnectionManager:
         if jira_number not in self.progress_connections:
             self.progress_connections[jira_number] = set()
         self.progress_connections[jira_number].add(websocket)
-        logger.info(f"Progress client connected for {jira_number}")
+        self._attach(websocket)
+        logger.info("Progress client connected for %s", jira_number)
         
-        # Send cached progress if exists
+        # Send cached progress if exists (replayed as-is, no re-serialization)
         if jira_number in self.progress_cache:
-            await websocket.send_json(self.progress_cache[jira_number].dict())
+            self._enqueue(websocket, self.progress_cache[jira_number])
 
     def disconnect(self, websocket: WebSocket):
+        self._detach(websocket)
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-            logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
+            if not self.active_connections:
+                self._has_clients.clear()
+            logger.info("Client disconnected. Total connections: %d", len(self.active_connections))
 
     def disconnect_progress(self, websocket: WebSocket, jira_number: str):
         """Disconnect from progress monitoring"""
@@ -96,135 +279,174 @@ class ConnectionManager:
             self.progress_connections[jira_number].discard(websocket)
             if not self.progress_connections[jira_number]:
                 del self.progress_connections[jira_number]
-            logger.info(f"Progress client disconnected from {jira_number}")
+            self._detach(websocket)
+            logger.info("Progress client disconnected from %s", jira_number)
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        disconnected = []
+        if not self.active_connections:
+            return  # Nobody listening: skip the encode entirely
+        # Encode once; each socket's sender task writes it out independently
+        payload = _encode(message)
         for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to client: {e}")
-                disconnected.append(connection)
-        
-        # Clean up disconnected clients
-        for conn in disconnected:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+            self._enqueue(connection, payload)
 
     async def broadcast_progress(self, update: ProgressUpdate):
         """Broadcast progress update to clients monitoring specific Jira"""
         jira_number = update.jiraNumber
         
-        # Cache the update
-        self.progress_cache[jira_number] = update
+        # Terminal states go out immediately, replacing anything still pending
+        if update.status in PROGRESS_TERMINAL_STATES:
+            self._pending.pop(jira_number, None)
+            flush = self._flush_task.pop(jira_number, None)
+            if flush:
+                flush.cancel()
+            self._send_progress(update)
+            return
         
-        # Broadcast to progress-specific clients
-        if jira_number in self.progress_connections:
-            disconnected = []
-            for connection in self.progress_connections[jira_number]:
-                try:
-                    await connection.send_json(update.dict())
-                except Exception as e:
-                    logger.error(f"Error sending progress to client: {e}")
-                    disconnected.append(connection)
-            
-            # Clean up disconnected clients
-            for conn in disconnected:
-                self.progress_connections[jira_number].discard(conn)
+        # Otherwise only the newest update of each debounce window is sent
+        self._pending[jira_number] = update
+        if jira_number not in self._flush_task:
+            self._flush_task[jira_number] = asyncio.create_task(
+                self._flush_after(jira_number, PROGRESS_DEBOUNCE)
+            )
+
+    async def _flush_after(self, jira_number: str, delay: float):
+        """Send the latest pending progress update for a Jira once the window closes"""
+        await asyncio.sleep(delay)
+        self._flush_task.pop(jira_number, None)
+        update = self._pending.pop(jira_number, None)
+        if update:
+            self._send_progress(update)
+
+    def _send_progress(self, update: ProgressUpdate):
+        """Cache a progress update and queue it for clients monitoring its Jira"""
+        jira_number = update.jiraNumber
+        # Encode once: the same payload goes to every client and to late subscribers
+        payload = update.model_dump_json()
+        
+        # Cache the payload, evicting the least recently updated Jira when full
+        self.progress_cache[jira_number] = payload
+        self.progress_cache.move_to_end(jira_number)
+        if len(self.progress_cache) > PROGRESS_CACHE_SIZE:
+            self.progress_cache.popitem(last=False)
+        
+        connections = self.progress_connections.get(jira_number)
+        if connections:
+            for connection in connections:
+                self._enqueue(connection, payload)
 
 manager = ConnectionManager()
 
 # Database monitoring
-def get_db_connection():
-    """Get database connection"""
-    try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        return conn
-    except Exception as e:
-        logger.error(f"Database connection error: {e}")
-        return None
+# One connection for the whole process: opening the database over the UNC share
+# on every request/poll costs an SMB round-trip and re-parses every statement
+_db_conn: Optional[sqlite3.Connection] = None
+_db_lock = threading.Lock()
+_task_sql: Dict[str, str] = {}
 
-def get_task_status(jira_number: str) -> Optional[Dict]:
-    """Get current status of a Jira task"""
-    conn = get_db_connection()
-    if not conn:
-        return None
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                jira_number, jira_heading, status, assignee, priority,
-                requirement_clarity, automation, created, last_updated, decision,
-                CASE WHEN generated_code_file IS NOT NULL THEN 1 ELSE 0 END as has_code,
-                CASE WHEN test_case_file IS NOT NULL THEN 1 ELSE 0 END as has_test,
-                comment
-            FROM jira_dashboard 
-            WHERE jira_number = ?
-        """, (jira_number,))
-        
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
-    finally:
-        conn.close()
+def _build_task_queries(conn: sqlite3.Connection):
+    """Fill _task_sql with task queries matching the columns jira_dashboard actually has"""
+    columns = {row[0] for row in conn.execute(SQL_DASHBOARD_COLUMNS)}
+    flags = {}
+    for flag, candidates in FILE_FLAG_COLUMNS.items():
+        column = next((name for name in candidates if name in columns), None)
+        flags[flag] = f"CASE WHEN {column} IS NOT NULL THEN 1 ELSE 0 END" if column else "0"
+    select = SQL_TASK_COLUMNS.format(**flags)
+    _task_sql.update({name: select + clause for name, clause in TASK_QUERY_CLAUSES.items()})
 
-def get_all_tasks() -> List[Dict]:
-    """Get all tasks from dashboard"""
+def get_db_connection() -> Optional[sqlite3.Connection]:
+    """Get the shared database connection, opening it on first use"""
+    global _db_conn
+    if _db_conn is not None:
+        return _db_conn
+    with _db_lock:
+        if _db_conn is None:
+            try:
+                conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=64)
+                conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA cache_size=-20000;
+                """)
+                _build_task_queries(conn)
+                _db_conn = conn
+            except Exception as e:
+                logger.error("Database connection error: %s", e)
+                return None
+    return _db_conn
+
+def close_db_connection():
+    """Close the shared database connection"""
+    global _db_conn
+    with _db_lock:
+        if _db_conn is not None:
+            _db_conn.close()
+            _db_conn = None
+
+def _query(sql: str, params: tuple = ()) -> List[tuple]:
+    """Run a read query on the shared connection"""
     conn = get_db_connection()
     if not conn:
         return []
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                jira_number, jira_heading, status, assignee, priority,
-                requirement_clarity, automation, created, last_updated, decision,
-                CASE WHEN generated_code_file IS NOT NULL THEN 1 ELSE 0 END as has_code,
-                CASE WHEN test_case_file IS NOT NULL THEN 1 ELSE 0 END as has_test,
-                comment
-            FROM jira_dashboard 
-            ORDER BY last_updated DESC
-        """)
-        
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
-    finally:
-        conn.close()
+    with _db_lock:
+        return conn.execute(sql, params).fetchall()
 
-def get_jira_prompts(jira_number: str) -> Optional[Dict]:
-    """Get prompt details from jira_prompts table"""
+def _query_tasks(name: str, params: tuple = ()) -> List[tuple]:
+    """Run one of the task queries built for the shared connection"""
+    if not get_db_connection():
+        return []
+    return _query(_task_sql[name], params)
+
+def _get_task_status_sync(jira_number: str) -> Optional[Dict]:
+    rows = _query_tasks("status", (jira_number,))
+    return dict(zip(TaskRow._fields, rows[0])) if rows else None
+
+def _get_all_tasks_sync() -> List[Dict]:
+    fields = TaskRow._fields
+    return [dict(zip(fields, row)) for row in _query_tasks("all")]
+
+def _get_jira_prompts_sync(jira_number: str) -> Optional[Dict]:
+    rows = _query(SQL_PROMPTS, (jira_number,))
+    return dict(zip(PromptRow._fields, rows[0])) if rows else None
+
+def _get_changed_tasks_sync(watermark: str) -> List[Dict]:
+    fields = TaskRow._fields
+    return [dict(zip(fields, row)) for row in _query_tasks("changed", (watermark,))]
+
+def _get_data_version_sync() -> Optional[int]:
+    rows = _query(SQL_DATA_VERSION)
+    return rows[0][0] if rows else None
+
+def _ensure_indexes_sync():
     conn = get_db_connection()
     if not conn:
-        return None
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                p_id, jira_number, category, 
-                CASE WHEN analysis_prompt IS NOT NULL THEN 1 ELSE 0 END as has_analysis,
-                CASE WHEN gen_code IS NOT NULL THEN 1 ELSE 0 END as has_code,
-                CASE WHEN gen_test_case IS NOT NULL THEN 1 ELSE 0 END as has_test,
-                CASE WHEN deployment_prompt IS NOT NULL THEN 1 ELSE 0 END as has_deployment,
-                rewards, created_at
-            FROM jira_prompts 
-            WHERE jira_number = ?
-            ORDER BY p_id DESC
-            LIMIT 1
-        """, (jira_number,))
-        
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
-    finally:
-        conn.close()
+        return
+    with _db_lock:
+        conn.execute(SQL_LAST_UPDATED_INDEX)
+        conn.commit()
+
+# SQLite calls block on SMB I/O, so they run on worker threads and the event
+# loop stays free for WebSocket traffic
+async def get_task_status(jira_number: str) -> Optional[Dict]:
+    """Get current status of a Jira task"""
+    return await asyncio.to_thread(_get_task_status_sync, jira_number)
+
+async def get_all_tasks() -> List[Dict]:
+    """Get all tasks from dashboard"""
+    return await asyncio.to_thread(_get_all_tasks_sync)
+
+async def get_jira_prompts(jira_number: str) -> Optional[Dict]:
+    """Get prompt details from jira_prompts table"""
+    return await asyncio.to_thread(_get_jira_prompts_sync, jira_number)
+
+async def get_data_version() -> Optional[int]:
+    """Get the database's data_version (changes when other connections commit)"""
+    return await asyncio.to_thread(_get_data_version_sync)
+
+async def get_changed_tasks(watermark: str) -> List[Dict]:
+    """Get tasks updated after watermark, oldest first"""
+    return await asyncio.to_thread(_get_changed_tasks_sync, watermark)
 
 # API Endpoints
 @app.get("/")
@@ -232,9 +454,12 @@ async def root():
     return {"message": "DevMind Monitoring Service", "status": "active"}
 
 @app.get("/api/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
-    db_status = "connected" if get_db_connection() else "disconnected"
+    # Reuse the lifespan connection; only retry opening it if startup could not
+    if request.app.state.db is None:
+        request.app.state.db = await asyncio.to_thread(get_db_connection)
+    db_status = "connected" if request.app.state.db else "disconnected"
     return {
         "status": "healthy",
         "database": db_status,
@@ -245,18 +470,18 @@ async def health_check():
 @app.get("/api/tasks")
 async def get_tasks():
     """Get all tasks"""
-    tasks = get_all_tasks()
+    tasks = await get_all_tasks()
     return {"tasks": tasks, "count": len(tasks)}
 
 @app.get("/api/tasks/{jira_number}")
 async def get_task(jira_number: str):
     """Get specific task status"""
-    task = get_task_status(jira_number)
+    task = await get_task_status(jira_number)
     if not task:
         return {"error": "Task not found"}, 404
     
     # Also get prompt details if available
-    prompts = get_jira_prompts(jira_number)
+    prompts = await get_jira_prompts(jira_number)
     
     return {
         "task": task,
@@ -270,7 +495,7 @@ async def notify_task_update(jira_number: str, update: TaskUpdate):
     Endpoint for MCP tools to notify about task updates
     This broadcasts updates to all connected WebSocket clients
     """
-    logger.info(f"Task update notification: {jira_number} - {update.stage} - {update.message}")
+    logger.info("Task update notification: %s - %s - %s", jira_number, update.stage, update.message)
     
     # Broadcast to all WebSocket clients
     await manager.broadcast({
@@ -286,7 +511,7 @@ async def receive_progress(update: ProgressUpdate):
     Receive progress updates from VS Code extension
     This is called by the extension as it tracks MCP tool calls
     """
-    logger.info(f"Progress update: {update.jiraNumber} - {update.progress}% - {update.message}")
+    logger.info("Progress update: %s - %d%% - %s", update.jiraNumber, update.progress, update.message)
     await manager.broadcast_progress(update)
     return {"status": "broadcasted"}
 
@@ -306,7 +531,7 @@ async def websocket_progress_monitor(websocket: WebSocket, jira_number: str):
     except WebSocketDisconnect:
         manager.disconnect_progress(websocket, jira_number)
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
         manager.disconnect_progress(websocket, jira_number)
 
 # WebSocket endpoint for real-time monitoring
@@ -320,7 +545,7 @@ async def websocket_monitor(websocket: WebSocket):
     
     try:
         # Send initial task list
-        tasks = get_all_tasks()
+        tasks = await get_all_tasks()
         await websocket.send_json({
             "type": "initial_data",
             "data": tasks,
@@ -338,7 +563,7 @@ async def websocket_monitor(websocket: WebSocket):
                     jira_number = message.get("jira_number")
                     if jira_number:
                         # Send current status
-                        task = get_task_status(jira_number)
+                        task = await get_task_status(jira_number)
                         if task:
                             await websocket.send_json({
                                 "type": "task_status",
@@ -365,49 +590,71 @@ async def websocket_monitor(websocket: WebSocket):
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
         manager.disconnect(websocket)
 
-# Database polling task (fallback if MCP tools don't send notifications)
-@app.on_event("startup")
-async def start_database_monitor():
-    """Background task to poll database for changes"""
-    asyncio.create_task(poll_database_changes())
-
 async def poll_database_changes():
-    """Poll database every 5 seconds for changes and broadcast to clients"""
-    last_check_times = {}
+    """Watch the database for commits by other processes and broadcast changed tasks"""
+    loop = asyncio.get_running_loop()
+    last_version = None
+    last_query = 0.0
     
     while True:
         try:
-            await asyncio.sleep(5)  # Poll every 5 seconds
+            # Sleep indefinitely on an idle server instead of waking every interval
+            await manager._has_clients.wait()
+            await asyncio.sleep(CHANGE_CHECK_INTERVAL)
             
             if len(manager.active_connections) == 0:
-                continue  # Skip if no clients connected
+                continue  # Last client left during the sleep
             
-            tasks = get_all_tasks()
+            # SQLite has no cross-process update hook; data_version is the
+            # cheapest signal that another connection wrote something
+            version = await get_data_version()
+            if version == last_version and loop.time() - last_query < CHANGE_FALLBACK_INTERVAL:
+                continue
+            last_version = version
+            last_query = loop.time()
             
-            for task in tasks:
-                jira_number = task['jira_number']
-                last_updated = task.get('last_updated', '')
-                
-                # Check if this task was updated since last check
-                if jira_number not in last_check_times or last_check_times[jira_number] != last_updated:
-                    last_check_times[jira_number] = last_updated
-                    
-                    # Broadcast update
-                    await manager.broadcast({
-                        "type": "task_changed",
-                        "data": task,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    
-                    logger.info(f"Detected change in task {jira_number}")
+            # Only rows touched since the last broadcast cross the share (indexed range scan).
+            # The MCP server stamps whole seconds and the To-Do sync microseconds, so the
+            # watermark's second is read again and rows already sent from it are dropped
+            tasks = [
+                task for task in await get_changed_tasks(manager._watermark)
+                if (task['jira_number'], task['last_updated']) not in manager._sent_at_watermark
+            ]
+            if not tasks:
+                continue
+            
+            # One frame per poll, however many tasks changed
+            await manager.broadcast({
+                "type": "task_changed_batch",
+                "data": tasks,
+                "timestamp": datetime.now().isoformat()
+            })
+            
+            logger.info("Detected change in %d task(s)", len(tasks))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Changed tasks: %s", ", ".join(task['jira_number'] for task in tasks))
+            
+            second = max(tasks[-1]['last_updated'][:19], manager._watermark)
+            if second != manager._watermark:
+                manager._watermark = second
+                manager._sent_at_watermark.clear()
+            manager._sent_at_watermark.update(
+                (task['jira_number'], task['last_updated'])
+                for task in tasks if task['last_updated'][:19] == second
+            )
                     
         except Exception as e:
-            logger.error(f"Error in database polling: {e}")
+            logger.error("Error in database polling: %s", e)
             await asyncio.sleep(10)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=5002, log_level="info")
+    # uvicorn[standard] provides httptools everywhere and uvloop on non-Windows hosts
+    # ("auto" falls back to asyncio there). Keep a single worker: connections,
+    # progress cache and watermark live in this process, so /api/notify and
+    # /api/progress must reach the same worker as the dashboards.
+    uvicorn.run(app, host="0.0.0.0", port=5002, loop="auto", http="httptools",
+                ws="websockets", workers=1, log_level="info")
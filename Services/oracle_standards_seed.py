@@ -0,0 +1,183 @@
+"""
+Seed data for the Oracle standards database
+
+Edit the tuples here, then run build_seed.py to regenerate
+oracle_standards_seed.sql, which init_oracle_standards_db.py loads.
+"""
+
+# ============================================================
+# ORGANIZATION ORACLE STANDARDS
+# ============================================================
+
+standards_data = [
+    (
+        "COFS",
+        "Creates or forgets synonyms. If synonym exists, does nothing.",
+        {
+            "P_OWNER": "Owner of synonym (PUBLIC, WEBLOGIC, etc.)",
+            "P_SYNONYM_NAME": "Synonym name",
+            "P_TABLE_OWNER": "Owner of the base table",
+            "P_TABLE_NAME": "Table name for which synonym is created",
+            "P_DEBUG": "Used for debug; prints without executing",
+        },
+        """STD_PKG_ANTUTIL.COFS('PUBLIC', '{COMPONENT}_TR_CUSTOMER_DUMMY', 'WEBLOGIC_DBA', '{COMPONENT}_TR_CUSTOMER_DUMMY');""",
+    ),
+    (
+        "DOFO",
+        "Drops or forgets objects. If object exists, it drops it; otherwise does nothing.",
+        {
+            "P_OWNER": "Object owner (WEBLOGIC_DBA, etc.)",
+            "P_OBJECT_TYPE": "FUNCTION, INDEX, PACKAGE, PROCEDURE, SEQUENCE, TRIGGER, VIEW, SYNONYM",
+            "P_OBJECT_NAME": "Object name",
+            "P_DEBUG": "Used for debug; prints without executing",
+        },
+        """BEGIN STD_PKG_ANTUTIL.DOFO('WEBLOGIC_DBA', 'SEQUENCE', '{COMPONENT}_SQ_DUM_CD_ID'); END;/""",
+    ),
+    (
+        "DOFT",
+        "Drops or forgets tables. If table exists, it drops it; otherwise does nothing.",
+        {
+            "P_OWNER": "Table owner (WEBLOGIC_DBA, etc.)",
+            "P_TABLE_NAME": "Table name",
+            "P_CASCADE": "Y/N; cascades constraints",
+            "P_DEBUG": "Used for debug; prints without executing",
+        },
+        """BEGIN STD_PKG_ANTUTIL.DOFT('WEBLOGIC_DBA', '{COMPONENT}_TR_CUSTOMER_DUMMY', 'Y'); END;/""",
+    ),
+    (
+        "DO_GRANT",
+        "Gives grants on objects to specified users or roles.",
+        {
+            "P_OWNER": "Owner of object",
+            "P_OBJECT_NAME": "Object name",
+            "P_GRANTEE": "User/role to grant access",
+            "P_PRIVILEGE": "SELECT,INSERT,UPDATE,DELETE,EXECUTE, etc.",
+            "P_GRANT_OPTION": "Y/N; allows further grant",
+            "P_ENVIRONMENT": "TEST, PREPROD, PROD (optional)",
+            "P_DEBUG": "Debug only",
+        },
+        """BEGIN
+    STD_PKG_ANTUTIL.DO_GRANT('WEBLOGIC_DBA', '{COMPONENT}_TR_ACCOUNT_DUMMY', 'UNIV_ORA', 'SELECT,INSERT,UPDATE,DELETE');
+END;/""",
+    ),
+    (
+        "DO_REVOKE",
+        "Revokes given grants from specified users or roles.",
+        {
+            "P_OWNER": "Owner of object",
+            "P_OBJECT_NAME": "Object name",
+            "P_GRANTEE": "User/role from which grant revoked",
+            "P_PRIVILEGE": "Privilege revoked",
+            "P_ENVIRONMENT": "TEST, PREPROD, PROD",
+            "P_DEBUG": "Debug only",
+        },
+        """BEGIN
+    STD_PKG_ANTUTIL.DO_REVOKE('WEBLOGIC_DBA', '{COMPONENT}_TR_ACCOUNT_DUMMY', 'UNIV_ORA', 'SELECT,INSERT,UPDATE,DELETE');
+END;/""",
+    ),
+]
+
+# ============================================================
+# BASE TEMPLATES
+# ============================================================
+
+templates = [
+    (
+        "TABLE",
+        "Base Table Creation Template",
+        """CREATE TABLE {COMPONENT}_TR_{ENTITY}_DUMMY (
+    {ENTITY_SHORT}_ID NUMBER,
+    {ENTITY_SHORT}_NAME VARCHAR2(100),
+    CREATED_DATE DATE DEFAULT SYSDATE,
+    CONSTRAINT {COMPONENT}_DUM_{ENTITY_SHORT}_ID_PK PRIMARY KEY ({ENTITY_SHORT}_ID)
+)
+TABLESPACE @@TB_DATI_BIG@@
+PCTFREE 10 PCTUSED 80;""",
+        "Standard structure for new tables following naming conventions and storage rules."
+    ),
+    (
+        "SEQUENCE",
+        "Base Sequence Template",
+        """CREATE SEQUENCE WEBLOGIC_DBA.{COMPONENT}_SQ_{ENTITY_SHORT}_ID
+START WITH 1
+INCREMENT BY 1
+NOCACHE;""",
+        "Standard sequence creation for table primary key columns."
+    ),
+    (
+        "INDEX",
+        "Base Index Template",
+        """CREATE INDEX {COMPONENT}_IDX_{ENTITY_SHORT}_{COLUMN_SHORT}
+ON {COMPONENT}_TR_{ENTITY}_DUMMY ({COLUMN_SHORT})
+TABLESPACE @@TB_IDX_BIG@@
+PCTFREE 10;""",
+        "Standard index creation on key columns following naming conventions."
+    )
+]
+
+# ============================================================
+# FULL CMU_TR_CUSTOMER_DUMMY SCRIPT
+# ============================================================
+
+cmu_sample_script = """
+BEGIN
+    STD_PKG_ANTUTIL.DOFT('WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY', 'Y');
+    STD_PKG_ANTUTIL.DOFO('WEBLOGIC_DBA', 'SEQUENCE', 'CMU_SQ_DUM_CD_ID');
+END;
+/
+
+
+CREATE TABLE CMU_TR_CUSTOMER_DUMMY (
+    CD_ID              NUMBER,
+    CD_CUSTOMER_ID     NUMBER,
+    CD_CUSTOMER_NAME   VARCHAR2(100),
+    CD_DATE_OF_BIRTH   DATE,
+    CD_ADDRESS         VARCHAR2(200),
+    CD_PHONE_NUMBER    VARCHAR2(15),
+    CONSTRAINT CMU_DUM_CD_ID_PK_101 PRIMARY KEY (CD_ID),
+    CONSTRAINT CMU_DUM_CD_CUSTOMER_ID_UK_1001 UNIQUE KEY (CD_CUSTOMER_ID)
+)
+TABLESPACE @@TB_DATI_BIG@@
+PCTFREE 10 PCTUSED 80
+/ 
+
+COMMENT ON COLUMN CMU_TR_CUSTOMER_DUMMY.CD_ID IS 'Sequence ID for customer dummy table'
+/
+COMMENT ON COLUMN CMU_TR_CUSTOMER_DUMMY.CD_CUSTOMER_ID IS 'Unique customer identifier'
+/
+COMMENT ON COLUMN CMU_TR_CUSTOMER_DUMMY.CD_CUSTOMER_NAME IS 'Full name of the customer'
+/
+COMMENT ON COLUMN CMU_TR_CUSTOMER_DUMMY.CD_DATE_OF_BIRTH IS 'Customer date of birth'
+/
+COMMENT ON COLUMN CMU_TR_CUSTOMER_DUMMY.CD_ADDRESS IS 'Customer residential address'
+/
+COMMENT ON COLUMN CMU_TR_CUSTOMER_DUMMY.CD_PHONE_NUMBER IS 'Customer contact phone number'
+/
+
+CREATE INDEX CMU_IDX_DUM_CD_CUSTOMER_ID ON CMU_TR_CUSTOMER_DUMMY (CD_CUSTOMER_ID)
+TABLESPACE @@TB_IDX_BIG@@
+PCTFREE 10
+/
+
+CREATE SEQUENCE WEBLOGIC_DBA.CMU_SQ_DUM_CD_ID START WITH 1 INCREMENT BY 1 NOCACHE
+/
+
+BEGIN
+    STD_PKG_ANTUTIL.DO_GRANT('WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY', 'UNIV_ORA', 'SELECT,INSERT,UPDATE,DELETE');
+    STD_PKG_ANTUTIL.DO_GRANT('WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY', 'ANOMALIA_CREDITI', 'SELECT,INSERT,UPDATE,DELETE');
+    STD_PKG_ANTUTIL.DO_GRANT('WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY', 'CONSULTA_COM', 'SELECT');
+    STD_PKG_ANTUTIL.DO_GRANT('WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY', 'CONSULTA_AF', 'SELECT');
+    STD_PKG_ANTUTIL.DO_GRANT('WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY', 'WLROLE', 'SELECT');
+    STD_PKG_ANTUTIL.DO_GRANT('WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY', 'WEBLOGIC81', 'SELECT');
+    STD_PKG_ANTUTIL.COFS('PUBLIC', 'CMU_TR_CUSTOMER_DUMMY', 'WEBLOGIC_DBA', 'CMU_TR_CUSTOMER_DUMMY');
+    STD_PKG_ANTUTIL.COFS('PUBLIC', 'CMU_SQ_DUM_CD_ID', 'WEBLOGIC_DBA', 'CMU_SQ_DUM_CD_ID');
+END;
+/
+"""
+
+templates.append((
+    "FULL_TABLE_SCRIPT",
+    "CMU_TR_CUSTOMER_DUMMY Sample Script",
+    cmu_sample_script,
+    "Full Oracle sample table creation script with sequences, indexes, comments, and grants."
+))
@@ -15,6 +15,7 @@ import sys
 import os
 import signal
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Optional
 
@@ -36,6 +37,20 @@ BACKEND_PATH = BASE_PATH / "Backend"
 SERVICES_PATH = BASE_PATH / "Services"
 DASHBOARD_PATH = BASE_PATH / "Dashboard"
 
+# Seconds to wait for a service to listen on its port, unless its spec sets startup_timeout
+DEFAULT_STARTUP_TIMEOUT = 30
+
+# Services to launch; none depends on another, so they start side by side
+SERVICES = [
+    dict(name="DevMind - Monitoring Service", command=['python', 'monitoring_service.py'],
+         cwd=SERVICES_PATH, port=5002),
+    dict(name="DevMind - Backend API", command=['python', 'main.py'],
+         cwd=BACKEND_PATH, port=8001),
+    dict(name="DevMind - Dashboard", command=['npm', 'start'],
+         cwd=DASHBOARD_PATH, port=3000, env={'NODE_OPTIONS': '--openssl-legacy-provider'},
+         startup_timeout=180),  # npm start compiles the bundle before it listens
+]
+
 # Process tracking
 processes: List[subprocess.Popen] = []
 
@@ -82,6 +97,11 @@ def is_port_in_use(port: int) -> bool:
         except socket.error:
             return True
 
+def is_port_listening(port: int) -> bool:
+    """Check if a service accepts connections on a port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        return s.connect_ex(('127.0.0.1', port)) == 0
+
 def check_port_availability(port: int, service_name: str) -> bool:
     """Check if port is available"""
     if is_port_in_use(port):
@@ -172,19 +192,27 @@ def cleanup_processes(signum=None, frame=None):
     
     sys.exit(0)
 
+def report_stopped_services(signum=None, frame=None):
+    """Report tracked service processes that have exited (SIGCHLD handler)"""
+    for i, process in enumerate(processes):
+        # returncode is still None only until poll() first reaps the process
+        if process.returncode is None and process.poll() is not None:
+            print_error(f"Service process {i} (PID: {process.pid}) has stopped unexpectedly")
+
 def wait_for_startup(port: int, service_name: str, timeout: int = 30) -> bool:
     """Wait for a service to start listening on its port"""
     print_info(f"Waiting for {service_name} to start...")
     start_time = time.time()
+    # Probe quickly at first so a fast service is seen within tens of ms
+    delay = 0.025
     
     while time.time() - start_time < timeout:
-        if is_port_in_use(port):
+        if is_port_listening(port):
             print_success(f"{service_name} is now running on port {port}")
             return True
-        time.sleep(1)
-        print(".", end="", flush=True)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
     
-    print()
     print_warning(f"{service_name} did not start within {timeout} seconds")
     return False
 
@@ -222,57 +250,41 @@ def main():
             print_error(f"Cannot proceed - port {port} is required for {service}")
             return
     
-    # Step 3: Start Monitoring Service
-    print_step(3, "Starting Monitoring Service")
-    monitoring_success = start_service(
-        name="DevMind - Monitoring Service",
-        command=['python', 'monitoring_service.py'],
-        cwd=SERVICES_PATH,
-        port=5002
-    )
-    
-    if not monitoring_success:
-        print_error("Failed to start Monitoring Service")
-        return
-    
-    # Wait a bit for monitoring service to initialize
-    time.sleep(2)
-    
-    # Step 4: Start Backend API
-    print_step(4, "Starting Backend API")
-    backend_success = start_service(
-        name="DevMind - Backend API",
-        command=['python', 'main.py'],
-        cwd=BACKEND_PATH,
-        port=8001
-    )
+    # Step 3: Start all services at once
+    print_step(3, "Starting Monitoring Service, Backend API and React Dashboard")
+    with ThreadPoolExecutor(max_workers=len(SERVICES)) as executor:
+        futures = [
+            executor.submit(start_service, **{k: v for k, v in spec.items() if k != 'startup_timeout'})
+            for spec in SERVICES
+        ]
+        results = [future.result() for future in futures]
     
-    if not backend_success:
-        print_error("Failed to start Backend API")
-        return
-    
-    # Wait for backend to initialize
-    time.sleep(2)
-    
-    # Step 5: Start Dashboard
-    print_step(5, "Starting React Dashboard")
-    dashboard_success = start_service(
-        name="DevMind - Dashboard",
-        command=['npm', 'start'],
-        cwd=DASHBOARD_PATH,
-        port=3000,
-        env={'NODE_OPTIONS': '--openssl-legacy-provider'}
-    )
+    for spec, success in zip(SERVICES, results):
+        if not success:
+            print_error(f"Failed to start {spec['name']}")
+            return
     
-    if not dashboard_success:
-        print_error("Failed to start Dashboard")
-        return
+    # Step 4: Wait until every service listens on its port
+    print_step(4, "Waiting for services to initialize")
+    with ThreadPoolExecutor(max_workers=len(SERVICES)) as executor:
+        started = list(executor.map(
+            lambda spec: wait_for_startup(
+                spec['port'], spec['name'], spec.get('startup_timeout', DEFAULT_STARTUP_TIMEOUT)),
+            SERVICES))
+    failed = [spec['name'] for spec, ok in zip(SERVICES, started) if not ok]
     
-    # Step 6: Display status
-    print_step(6, "Service Status Summary")
-    print(f"\n{Colors.OKGREEN}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{Colors.BOLD}  All Services Started Successfully!{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{'='*60}{Colors.ENDC}\n")
+    # Step 5: Display status
+    print_step(5, "Service Status Summary")
+    if failed:
+        print(f"\n{Colors.WARNING}{'='*60}{Colors.ENDC}")
+        print(f"{Colors.WARNING}{Colors.BOLD}  Some Services Did Not Start:{Colors.ENDC}")
+        for name in failed:
+            print_error(name)
+        print(f"{Colors.WARNING}{'='*60}{Colors.ENDC}\n")
+    else:
+        print(f"\n{Colors.OKGREEN}{'='*60}{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}{Colors.BOLD}  All Services Started Successfully!{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}{'='*60}{Colors.ENDC}\n")
     
     print(f"{Colors.BOLD}📋 Service Endpoints:{Colors.ENDC}")
     print(f"  {Colors.OKCYAN}• Monitoring Service:{Colors.ENDC} http://localhost:5002")
@@ -290,9 +302,7 @@ def main():
     print(f"  {Colors.OKBLUE}API Health:{Colors.ENDC}  curl http://localhost:8001/health")
     print(f"  {Colors.OKBLUE}Monitor:{Colors.ENDC}     curl http://localhost:5002/api/health")
     
-    # Wait a bit before opening browser
-    print(f"\n{Colors.OKGREEN}Opening Dashboard in browser in 5 seconds...{Colors.ENDC}")
-    time.sleep(5)
+    print(f"\n{Colors.OKGREEN}Opening Dashboard in browser...{Colors.ENDC}")
     
     # Open dashboard in browser
     try:
@@ -305,17 +315,24 @@ def main():
     except Exception as e:
         print_warning(f"Could not open browser automatically: {e}")
     
-    print(f"\n{Colors.OKGREEN}{Colors.BOLD}✓ DevMind System is now running!{Colors.ENDC}")
+    if failed:
+        print_warning(f"DevMind System is running without: {', '.join(failed)}")
+    else:
+        print(f"\n{Colors.OKGREEN}{Colors.BOLD}✓ DevMind System is now running!{Colors.ENDC}")
     print(f"{Colors.WARNING}Press Ctrl+C to stop all services{Colors.ENDC}\n")
     
-    # Keep script running
+    # Keep script running, sleeping until a signal arrives instead of polling
     try:
-        while True:
-            time.sleep(1)
-            # Check if any process has died
-            for i, process in enumerate(processes):
-                if process.poll() is not None:
-                    print_error(f"Service process {i} (PID: {process.pid}) has stopped unexpectedly")
+        if hasattr(signal, 'SIGCHLD'):
+            signal.signal(signal.SIGCHLD, report_stopped_services)
+            report_stopped_services()  # Anything that exited before the handler was installed
+            while True:
+                signal.pause()
+        else:
+            # On Windows the services run in their own terminal windows and are not
+            # tracked here, so there is nothing to watch until Ctrl+C
+            while True:
+                time.sleep(3600)
     except KeyboardInterrupt:
         cleanup_processes()
 